@@ -108,8 +108,6 @@ class MyBMWAccount:
 
     async def get_vehicles(self, force_init: bool = False) -> None:
         """Retrieve vehicle data from BMW servers."""
-        _LOGGER.debug("Getting vehicle list")
-
         if len(self.vehicles) == 0 or force_init:
             await self._init_vehicles()
 
@@ -142,9 +140,10 @@ class MyBMWAccount:
 
         existing_vehicle = self.get_vehicle(vehicle_base["vin"])
 
-        # If vehicle already exists, just update it's state
+        # If vehicle already exists, just update its base data. The state is fetched separately in `get_vehicles()`,
+        # so we avoid requesting it twice on a forced init.
         if existing_vehicle:
-            await existing_vehicle.get_vehicle_state()
+            existing_vehicle.update_state(vehicle_base, fetched_at)
         else:
             self.vehicles.append(MyBMWVehicle(self, vehicle_base, fetched_at))
 
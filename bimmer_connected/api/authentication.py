@@ -5,6 +5,7 @@ import base64
 import datetime
 import logging
 import math
+import re
 import ssl
 from collections import defaultdict
 from typing import AsyncGenerator, Generator, Optional, Union
@@ -22,6 +23,7 @@ from bimmer_connected.api.utils import (
     generate_token,
     get_capture_position,
     get_correlation_id,
+    get_ssl_context,
     handle_httpstatuserror,
     try_import_pillow_image,
 )
@@ -38,6 +40,7 @@ from bimmer_connected.const import (
 from bimmer_connected.models import MyBMWAPIError, MyBMWCaptchaMissingError
 
 EXPIRES_AT_OFFSET = datetime.timedelta(seconds=HTTPX_TIMEOUT * 2)
+RE_RETRY_WAIT_TIME = re.compile(r"\d")
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -92,8 +95,8 @@ class MyBMWAuthentication(httpx.Auth):
         # Try getting a response
         response: httpx.Response = (yield request)
 
-        # return directly if first response was successful
-        if response.is_success:
+        # return directly if first response was successful or not modified (conditional request)
+        if response.is_success or response.status_code == 304:
             return
 
         await response.aread()
@@ -318,9 +321,11 @@ class MyBMWAuthentication(httpx.Auth):
                 AUTH_CHINA_CAPTCHA_URL,
                 json={"mobile": self.username},
             )
-            verify_id = captcha_res.json()["data"]["verifyId"]
+            # Decode the response only once, as it contains the full base64-encoded background image
+            captcha_data = captcha_res.json()["data"]
+            verify_id = captcha_data["verifyId"]
 
-            position = get_capture_position(captcha_res.json()["data"]["backGroundImg"])
+            position = get_capture_position(captcha_data["backGroundImg"])
             await client.post(AUTH_CHINA_CAPTCHA_CHECK_URL, json={"position": position, "verifyId": verify_id})
 
             # Get token
@@ -389,6 +394,9 @@ class MyBMWLoginClient(httpx.AsyncClient):
 
         kwargs["auth"] = MyBMWLoginRetry()
 
+        # Reuse the default SSL context instead of loading the certificates for every client
+        kwargs["verify"] = get_ssl_context(kwargs.get("verify", True))
+
         # Set default values#
         region = kwargs.pop("region")
         kwargs["base_url"] = get_server_url(region)
@@ -446,8 +454,9 @@ class MyBMWLoginRetry(httpx.Auth):
 def get_retry_wait_time(response: httpx.Response) -> int:
     """Get the wait time for the next retry from the response and multiply by 2."""
     try:
-        response_wait_time = next(iter([int(i) for i in response.json().get("message", "") if i.isdigit()]))
+        match = RE_RETRY_WAIT_TIME.search(response.json().get("message", ""))
     except Exception:
-        response_wait_time = 2
+        match = None
+    response_wait_time = int(match.group()) if match else 2
     wait_time = math.ceil(response_wait_time * 2)
     return wait_time
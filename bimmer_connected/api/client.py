@@ -10,7 +10,12 @@ import httpx
 
 from bimmer_connected.api.authentication import MyBMWAuthentication
 from bimmer_connected.api.regions import get_app_version, get_server_url, get_user_agent
-from bimmer_connected.api.utils import anonymize_response, get_correlation_id, handle_httpstatuserror
+from bimmer_connected.api.utils import (
+    anonymize_response,
+    get_correlation_id,
+    get_ssl_context,
+    handle_httpstatuserror,
+)
 from bimmer_connected.const import HTTPX_TIMEOUT, X_USER_AGENT, CarBrands
 from bimmer_connected.models import AnonymizedResponse, GPSPosition
 
@@ -48,8 +53,9 @@ class MyBMWClient(httpx.AsyncClient):
         kwargs["timeout"] = httpx.Timeout(HTTPX_TIMEOUT)
 
         # Use external SSL context stored in MyBMWClientConfiguration. Required in Home Assistant due to event loop
-        # blocking when httpx loads SSL certificates from disk. If not given, uses httpx defaults.
-        kwargs["verify"] = self.config.verify
+        # blocking when httpx loads SSL certificates from disk. If not given, a shared context with httpx defaults
+        # is used.
+        kwargs["verify"] = get_ssl_context(self.config.verify)
 
         # Set default values
         kwargs["base_url"] = kwargs.get("base_url") or get_server_url(config.authentication.region)
@@ -10,8 +10,10 @@ import logging
 import mimetypes
 import random
 import re
+import ssl
 import string
-from typing import Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from uuid import uuid4
 
 import httpx
@@ -25,6 +27,33 @@ from bimmer_connected.models import AnonymizedResponse, MyBMWAPIError, MyBMWAuth
 UNICODE_CHARACTER_SET = string.ascii_letters + string.digits + "-._~"
 RE_VIN = re.compile(r"(?P<vin>[(A-H|J-N|P|R-Z|0-9)]{3}[A-Z0-9]{14})")
 ANONYMIZED_VINS: Dict[str, str] = {}
+ANONYMIZED_VALUES: Dict[str, Any] = {
+    "lat": 12.3456,
+    "latitude": 12.3456,
+    "lon": 34.5678,
+    "longitude": 34.5678,
+    "heading": 123,
+    "licensePlate": "some_license_plate",
+    "name": "some_name",
+    "city": "some_city",
+    "street": "some_street",
+    "streetNumber": "999",
+    "postalCode": "some_postal_code",
+    "phone": "some_phone",
+    "formatted": "some_formatted_address",
+    "subtitle": "some_road \u2022 duration \u2022 -- EUR",
+}
+
+
+@lru_cache(maxsize=None)
+def _default_ssl_context() -> ssl.SSLContext:
+    """Create the SSL context httpx would use by default."""
+    return httpx.create_ssl_context()
+
+
+def get_ssl_context(verify: Union[ssl.SSLContext, str, bool]) -> Union[ssl.SSLContext, str, bool]:
+    """Replace `verify=True` with a shared default SSL context, so certificates are only loaded once."""
+    return _default_ssl_context() if verify is True else verify
 
 
 def generate_token(length: int = 30, chars: str = UNICODE_CHARACTER_SET) -> str:
@@ -92,37 +121,36 @@ async def handle_httpstatuserror(
 def anonymize_data(json_data: Union[List, Dict]) -> Union[List, Dict]:
     """Replace parts of the logfiles containing personal information."""
 
-    replacements = {
-        "lat": 12.3456,
-        "latitude": 12.3456,
-        "lon": 34.5678,
-        "longitude": 34.5678,
-        "heading": 123,
-        "licensePlate": "some_license_plate",
-        "name": "some_name",
-        "city": "some_city",
-        "street": "some_street",
-        "streetNumber": "999",
-        "postalCode": "some_postal_code",
-        "phone": "some_phone",
-        "formatted": "some_formatted_address",
-        "subtitle": "some_road \u2022 duration \u2022 -- EUR",
-    }
-
-    if isinstance(json_data, list):
-        json_data = [anonymize_data(v) for v in json_data]
-    elif isinstance(json_data, dict):
-        for key, value in json_data.items():
-            if key in replacements:
-                json_data[key] = replacements[key]
-            elif isinstance(value, str):
-                json_data[key] = RE_VIN.sub(anonymize_vin, json_data[key])
-            else:
-                json_data[key] = anonymize_data(value)
+    if not isinstance(json_data, (list, dict)):
+        return json_data
+
+    # Walk the containers depth-first with a stack of iterators instead of recursing. Values are replaced in place
+    # and in document order, so VINs keep their numbering.
+    stack: List[Tuple[Union[List, Dict], Iterator[Tuple[Any, Any]]]] = [(json_data, _iter_items(json_data))]
+    while stack:
+        container, items = stack[-1]
+        for key, value in items:
+            if isinstance(container, dict):
+                if key in ANONYMIZED_VALUES:
+                    container[key] = ANONYMIZED_VALUES[key]
+                    continue
+                if isinstance(value, str):
+                    container[key] = RE_VIN.sub(anonymize_vin, value)
+                    continue
+            if isinstance(value, (list, dict)):
+                stack.append((value, _iter_items(value)))
+                break
+        else:
+            stack.pop()
 
     return json_data
 
 
+def _iter_items(container: Union[List, Dict]) -> Iterator[Tuple[Any, Any]]:
+    """Iterate over (key, value) pairs of a dict or (index, value) pairs of a list."""
+    return iter(container.items()) if isinstance(container, dict) else enumerate(container)
+
+
 def anonymize_vin(match: re.Match):
     """Anonymize VINs but keep assignment."""
     vin = match.groupdict()["vin"]
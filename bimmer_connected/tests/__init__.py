@@ -1,12 +1,21 @@
 """Mock for Connected Drive Backend."""
 
-import json
+import logging
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, Iterator, Union
+
+import orjson
 
 from bimmer_connected.api.regions import Regions
 from bimmer_connected.const import CarBrands
 
+# orjson is a test requirement, use it for all JSON handling in the tests
+json_dumps = orjson.dumps
+json_loads = orjson.loads
+
 RESPONSE_DIR = Path(__file__).parent / "responses"
 
 TEST_USERNAME = "some_user"
@@ -40,45 +49,79 @@ REMOTE_SERVICE_RESPONSE_EVENTPOSITION = RESPONSE_DIR / "remote_services" / "eadr
 
 def get_fingerprint_count(type: str) -> int:
     """Return number of requests/fingerprints for a given type."""
+    return _FINGERPRINT_COUNTS.get(type, 0)
 
-    if type == "vehicles":
-        return len(CarBrands)
-    if type == "states":
-        return len(ALL_STATES)
-    if type == "profiles":
-        return len(ALL_PROFILES)
-    if type == "charging_settings":
-        return len(ALL_CHARGING_SETTINGS)
-    return 0
+
+@lru_cache(maxsize=None)
+def _read_response(path: str) -> bytes:
+    """Read a stored response from disk once."""
+    with open(path, "rb") as file:
+        return file.read()
+
+
+@lru_cache(maxsize=None)
+def _parse_response(path: str) -> Any:
+    """Parse a stored response once."""
+    content = _read_response(path)
+    if path.endswith(".json"):
+        return json_loads(content)
+    return content.decode("UTF-8")
 
 
 def load_response(path: Union[Path, str]) -> Any:
-    """Load a stored response."""
-    with open(path, "rb") as file:
-        if Path(path).suffix == ".json":
-            return json.load(file)
-        return file.read().decode("UTF-8")
+    """Load a stored response. The result is shared, so copy it before modifying."""
+    return _parse_response(str(path))
+
+
+def _iter_json_files(root: Path) -> Iterator[os.DirEntry]:
+    """Recursively yield all JSON files in a directory, reading each directory only once."""
+    directories = [str(root)]
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                elif entry.name.endswith(".json"):
+                    yield entry
+
+
+for fingerprint in _iter_json_files(RESPONSE_DIR):
+    stem = fingerprint.name[: -len(".json")]
+
+    if stem.endswith("-eadrax-vcs_v5_vehicle-list"):
+        brand = stem.split("-")[0]
+        response = load_response(fingerprint.path)
+
+        # Index vehicles by VIN for fast filtering in the mocked vehicle list
+        vehicles = ALL_VEHICLES[brand].setdefault("mappingInfos", {})
+        vehicles.update((sys.intern(vehicle["vin"]), vehicle) for vehicle in response["mappingInfos"])
+        ALL_VEHICLES[brand]["gcid"] = response["gcid"]
 
+    elif "-eadrax-vcs_v5_vehicle-data_profile_" in stem:
+        ALL_PROFILES[stem.split("_")[-1]] = load_response(fingerprint.path)
 
-for fingerprint in RESPONSE_DIR.rglob("*-eadrax-vcs_v5_vehicle-list.json"):
-    brand = fingerprint.stem.split("-")[0]
-    response = load_response(fingerprint)
+    elif "-eadrax-vcs_v4_vehicles_state_" in stem:
+        ALL_STATES[stem.split("_")[-1]] = load_response(fingerprint.path)
 
-    if ALL_VEHICLES[brand].get("mappingInfos"):
-        ALL_VEHICLES[brand]["mappingInfos"].extend(response["mappingInfos"])
-    else:
-        ALL_VEHICLES[brand] = response
+    elif "-eadrax-crccs_v2_vehicles_" in stem:
+        ALL_CHARGING_SETTINGS[stem.split("_")[-1]] = load_response(fingerprint.path)
 
-for profile in RESPONSE_DIR.rglob("*-eadrax-vcs_v5_vehicle-data_profile_*.json"):
-    ALL_PROFILES[profile.stem.split("_")[-1]] = load_response(profile)
+# Fingerprints are only loaded at import, so their counts never change
+_FINGERPRINT_COUNTS = {
+    "vehicles": len(CarBrands),
+    "states": len(ALL_STATES),
+    "profiles": len(ALL_PROFILES),
+    "charging_settings": len(ALL_CHARGING_SETTINGS),
+}
+# Number of JSON responses when fetching all vehicles (vehicle lists, profiles, states and charging settings)
+FINGERPRINT_JSON_COUNT = sum(_FINGERPRINT_COUNTS.values())
 
-for state in RESPONSE_DIR.rglob("*-eadrax-vcs_v4_vehicles_state_*.json"):
-    ALL_STATES[state.stem.split("_")[-1]] = load_response(state)
 
-for charging_setting in RESPONSE_DIR.rglob("*-eadrax-crccs_v2_vehicles_*.json"):
-    ALL_CHARGING_SETTINGS[charging_setting.stem.split("_")[-1]] = load_response(charging_setting)
+def _is_deprecation_warning(record: logging.LogRecord) -> bool:
+    """Check if a log record is a logged DeprecationWarning."""
+    return record.levelno == logging.WARNING and "DeprecationWarning" in record.getMessage()
 
 
-def get_deprecation_warning_count(caplog):
-    """Return all logged DeprecationWarnings."""
-    return [r for r in caplog.records if r.levelname == "WARNING" and "DeprecationWarning" in r.message]
+def get_deprecation_warning_count(caplog) -> int:
+    """Return the number of logged DeprecationWarnings."""
+    return sum(1 for r in caplog.records if _is_deprecation_warning(r))
@@ -1,10 +1,13 @@
 """Fixtures for BMW tests."""
 
-import json
+import re
+import sys
 from collections import defaultdict
-from copy import deepcopy
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, Generator, Iterator, List, Optional, Tuple, Union
 from unittest import mock
 from uuid import uuid4
 
@@ -25,6 +28,8 @@ from . import (
     REMOTE_SERVICE_RESPONSE_INITIATED,
     REMOTE_SERVICE_RESPONSE_PENDING,
     RESPONSE_DIR,
+    json_dumps,
+    json_loads,
     load_response,
 )
 
@@ -38,23 +43,60 @@ POI_DATA = {
     "country": "United States",
 }
 
-CHARGING_SETTINGS = {"target_soc": 75, "ac_limit": 16}
+CHARGING_SETTINGS = MappingProxyType({"target_soc": 75, "ac_limit": 16})
 
-STATUSREMOTE_SERVICE_RESPONSE_ORDER = [
+STATUSREMOTE_SERVICE_RESPONSE_ORDER = (
     REMOTE_SERVICE_RESPONSE_PENDING,
     REMOTE_SERVICE_RESPONSE_DELIVERED,
     REMOTE_SERVICE_RESPONSE_EXECUTED,
-]
-STATUSREMOTE_SERVICE_RESPONSE_DICT: Dict[str, List[Path]] = defaultdict(
-    lambda: deepcopy(STATUSREMOTE_SERVICE_RESPONSE_ORDER)
+)
+STATUSREMOTE_SERVICE_RESPONSE_DICT: Dict[str, Iterator[Path]] = defaultdict(
+    lambda: iter(STATUSREMOTE_SERVICE_RESPONSE_ORDER)
+)
+
+MAP_REMOTE_SERVICE_CHARGING_MODE_TO_STATE = MappingProxyType(
+    {v: k.value for k, v in MAP_CHARGING_MODE_TO_REMOTE_SERVICE.items()}
 )
 
-MAP_REMOTE_SERVICE_CHARGING_MODE_TO_STATE = {v: k.value for k, v in MAP_CHARGING_MODE_TO_REMOTE_SERVICE.items()}
+_RE_REMOTE_COMMAND = re.compile(r"/eadrax-vrccs/v4/presentation/remote-commands/(?!event.*)(?P<service>.+)$")
+_RE_CHARGING_COMMAND = re.compile(r"/eadrax-crccs/v1/vehicles/(?P<vin>.+)/(?P<service>(start|stop)-charging)$")
+_RE_CHARGING_SETTINGS = re.compile(r"/eadrax-crccs/v1/vehicles/(?P<vin>.+)/charging-settings$")
+_RE_CHARGING_PROFILE = re.compile(r"/eadrax-crccs/v1/vehicles/(?P<vin>.+)/charging-profile$")
+_RE_SEND_TO_CAR = re.compile(r"/eadrax-dcs/v2/user/(?P<gcid>.+)/send-to-car$")
+
+_CHARGING_SETTINGS_PARAMS = ("fields", "has_charging_settings_capabilities")
+
+_JSON_HEADERS = {"content-type": "application/json"}
+_OAUTH_CONFIG_JSON = (RESPONSE_DIR / "auth" / "oauth_config.json").read_bytes()
+_AUTH_TOKEN_JSON = (RESPONSE_DIR / "auth" / "auth_token.json").read_bytes()
+_AUTH_CN_PUBLICKEY_JSON = (RESPONSE_DIR / "auth" / "auth_cn_publickey.json").read_bytes()
+_AUTH_SLIDER_CAPTCHA_JSON = (RESPONSE_DIR / "auth" / "auth_slider_captcha.json").read_bytes()
+_AUTH_SLIDER_CAPTCHA_CHECK_JSON = (RESPONSE_DIR / "auth" / "auth_slider_captcha_check.json").read_bytes()
+_AUTH_CN_LOGIN_PWD_JSON = (RESPONSE_DIR / "auth" / "auth_cn_login_pwd.json").read_bytes()
+_AUTHORIZATION_RESPONSE_JSON = (RESPONSE_DIR / "auth" / "authorization_response.json").read_bytes()
+_EVENTPOSITION_JSON = REMOTE_SERVICE_RESPONSE_EVENTPOSITION.read_bytes()
+_STATUS_JSON: Dict[Path, bytes] = {path: path.read_bytes() for path in STATUSREMOTE_SERVICE_RESPONSE_ORDER}
 
 LOCAL_STATES: Dict[str, Dict] = {}
 LOCAL_CHARGING_SETTINGS: Dict[str, Dict] = {}
 
 
+@lru_cache(maxsize=None)
+def _split_x_user_agent(x_user_agent: str) -> Tuple[str, ...]:
+    """Split the x-user-agent header into its parts."""
+    return tuple(x_user_agent.split(";"))
+
+
+def _json_response(content: Union[bytes, str]) -> httpx.Response:
+    """Return a successful response with already serialized JSON content."""
+    return httpx.Response(200, content=content, headers=_JSON_HEADERS)
+
+
+def _copy_fixtures(fixtures: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Return an independent copy of JSON fixtures via a serialization round trip."""
+    return json_loads(json_dumps(fixtures))
+
+
 class MyBMWMockRouter(respx.MockRouter):
     """Stateful MockRouter for MyBMW APIs."""
 
@@ -70,15 +112,26 @@ class MyBMWMockRouter(respx.MockRouter):
     ) -> None:
         """Initialize the MyBMWMockRouter with clean responses."""
         super().__init__(assert_all_called=False)
-        self.vehicles_to_load = vehicles_to_load or []
-        self.profiles = deepcopy(profiles) if profiles else {}
-        self.states = deepcopy(states) if states else {}
-        self.charging_settings = deepcopy(charging_settings) if charging_settings else {}
+        self.load_fixtures(vehicles_to_load, profiles, states, charging_settings)
 
         self.add_login_routes()
         self.add_vehicle_routes()
         self.add_remote_service_routes()
 
+    def load_fixtures(
+        self,
+        vehicles_to_load: Optional[List[str]] = None,
+        profiles: Optional[Dict[str, Dict]] = None,
+        states: Optional[Dict[str, Dict]] = None,
+        charging_settings: Optional[Dict[str, Dict]] = None,
+    ) -> None:
+        """Replace the vehicle data served by the router with clean copies."""
+        self.vehicles_to_load = frozenset(sys.intern(vin) for vin in vehicles_to_load or [])
+        # Profiles are never modified by the mocked API, so they can be shared between routers
+        self.profiles = profiles or {}
+        self.states = _copy_fixtures(states) if states else {}
+        self.charging_settings = _copy_fixtures(charging_settings) if charging_settings else {}
+
     # # # # # # # # # # # # # # # # # # # # # # # #
     # Routes
     # # # # # # # # # # # # # # # # # # # # # # # #
@@ -88,31 +141,23 @@ class MyBMWMockRouter(respx.MockRouter):
 
         # Login to north_america and rest_of_world
         self.get("/eadrax-ucs/v1/presentation/oauth/config").respond(
-            200, json=load_response(RESPONSE_DIR / "auth" / "oauth_config.json")
+            200, content=_OAUTH_CONFIG_JSON, headers=_JSON_HEADERS
         )
         self.post("/gcdm/oauth/authenticate", name="authenticate").mock(side_effect=self.authenticate_sideeffect)
-        self.post("/gcdm/oauth/token", name="token").respond(
-            200, json=load_response(RESPONSE_DIR / "auth" / "auth_token.json")
-        )
+        self.post("/gcdm/oauth/token", name="token").respond(200, content=_AUTH_TOKEN_JSON, headers=_JSON_HEADERS)
 
         # Login to china
-        self.get("/eadrax-coas/v1/cop/publickey").respond(
-            200, json=load_response(RESPONSE_DIR / "auth" / "auth_cn_publickey.json")
-        )
+        self.get("/eadrax-coas/v1/cop/publickey").respond(200, content=_AUTH_CN_PUBLICKEY_JSON, headers=_JSON_HEADERS)
         self.post("/eadrax-coas/v2/cop/slider-captcha").respond(
-            200, json=load_response(RESPONSE_DIR / "auth" / "auth_slider_captcha.json")
+            200, content=_AUTH_SLIDER_CAPTCHA_JSON, headers=_JSON_HEADERS
         )
 
         self.post("/eadrax-coas/v1/cop/check-captcha").respond(
-            200, json=load_response(RESPONSE_DIR / "auth" / "auth_slider_captcha_check.json")
+            200, content=_AUTH_SLIDER_CAPTCHA_CHECK_JSON, headers=_JSON_HEADERS
         )
 
-        self.post("/eadrax-coas/v2/login/pwd").respond(
-            200, json=load_response(RESPONSE_DIR / "auth" / "auth_cn_login_pwd.json")
-        )
-        self.post("/eadrax-coas/v2/oauth/token").respond(
-            200, json=load_response(RESPONSE_DIR / "auth" / "auth_token.json")
-        )
+        self.post("/eadrax-coas/v2/login/pwd").respond(200, content=_AUTH_CN_LOGIN_PWD_JSON, headers=_JSON_HEADERS)
+        self.post("/eadrax-coas/v2/oauth/token").respond(200, content=_AUTH_TOKEN_JSON, headers=_JSON_HEADERS)
 
     def add_vehicle_routes(self) -> None:
         """Add routes for vehicle requests."""
@@ -122,29 +167,35 @@ class MyBMWMockRouter(respx.MockRouter):
         self.get("/eadrax-vcs/v4/vehicles/state", name="state").mock(side_effect=self.vehicle_state_sideeffect)
         self.get("/eadrax-crccs/v2/vehicles").mock(side_effect=self.vehicle_charging_settings_sideeffect)
 
+    @contextmanager
+    def routes_before(self, name: str) -> Generator[None, None, None]:
+        """Match routes added inside the block before the named route.
+
+        respx matches routes in order, so a more specific route added after a generic one is never used. The
+        session router's rollback restores the original routes after the test.
+        """
+        route = self.routes.pop(name)
+        try:
+            yield
+        finally:
+            self.routes.add(route, name)
+
     def add_remote_service_routes(self) -> None:
         """Add routes for remote services."""
 
-        self.post(path__regex=r"/eadrax-vrccs/v4/presentation/remote-commands/(?!event.*)(?P<service>.+)$").mock(
-            side_effect=self.service_trigger_sideeffect
-        )
-        self.post(path__regex=r"/eadrax-crccs/v1/vehicles/(?P<vin>.+)/(?P<service>(start|stop)-charging)$").mock(
-            side_effect=self.service_trigger_sideeffect
-        )
-        self.post(path__regex=r"/eadrax-crccs/v1/vehicles/(?P<vin>.+)/charging-settings$").mock(
-            side_effect=self.charging_settings_sideeffect
-        )
-        self.post(path__regex=r"/eadrax-crccs/v1/vehicles/(?P<vin>.+)/charging-profile$").mock(
-            side_effect=self.charging_profile_sideeffect
-        )
+        self.post(path__regex=_RE_REMOTE_COMMAND).mock(side_effect=self.service_trigger_sideeffect)
+        self.post(path__regex=_RE_CHARGING_COMMAND).mock(side_effect=self.service_trigger_sideeffect)
+        self.post(path__regex=_RE_CHARGING_SETTINGS).mock(side_effect=self.charging_settings_sideeffect)
+        self.post(path__regex=_RE_CHARGING_PROFILE).mock(side_effect=self.charging_profile_sideeffect)
         self.post("/eadrax-vrccs/v3/presentation/remote-commands/eventStatus", params={"eventId": mock.ANY}).mock(
             side_effect=self.service_status_sideeffect
         )
 
-        self.post(path__regex=r"/eadrax-dcs/v2/user/(?P<gcid>.+)/send-to-car$").mock(side_effect=self.poi_sideeffect)
+        self.post(path__regex=_RE_SEND_TO_CAR).mock(side_effect=self.poi_sideeffect)
         self.post("/eadrax-vrccs/v4/presentation/remote-commands/eventPosition", params={"eventId": mock.ANY}).respond(
             200,
-            json=load_response(REMOTE_SERVICE_RESPONSE_EVENTPOSITION),
+            content=_EVENTPOSITION_JSON,
+            headers=_JSON_HEADERS,
         )
 
     # # # # # # # # # # # # # # # # # # # # # # # #
@@ -156,7 +207,7 @@ class MyBMWMockRouter(respx.MockRouter):
         """Return /oauth/authentication response based on request."""
         request_text = request.read().decode("UTF-8")
         if "username" in request_text and "password" in request_text and "grant_type" in request_text:
-            return httpx.Response(200, json=load_response(RESPONSE_DIR / "auth" / "authorization_response.json"))
+            return _json_response(_AUTHORIZATION_RESPONSE_JSON)
         return httpx.Response(
             302,
             headers={
@@ -170,7 +221,7 @@ class MyBMWMockRouter(respx.MockRouter):
 
     def vehicles_sideeffect(self, request: httpx.Request) -> httpx.Response:
         """Return /vehicles response based on x-user-agent."""
-        x_user_agent = request.headers.get("x-user-agent", "").split(";")
+        x_user_agent = _split_x_user_agent(request.headers.get("x-user-agent", ""))
         if len(x_user_agent) == 4:
             brand = x_user_agent[1]
         else:
@@ -179,46 +230,43 @@ class MyBMWMockRouter(respx.MockRouter):
         # Test if given region is valid
         _ = Regions(x_user_agent[3])
 
-        fingerprints = deepcopy(ALL_VEHICLES.get(brand, {"mappingInfos": []}))
-        if self.vehicles_to_load:
-            fingerprints["mappingInfos"] = [
-                f for f in fingerprints["mappingInfos"] if f["vin"] in self.vehicles_to_load
-            ]
+        brand_vehicles = ALL_VEHICLES.get(brand, {})
+        vehicles = brand_vehicles.get("mappingInfos", {})
+        vins = self.vehicles_to_load.intersection(vehicles) if self.vehicles_to_load else vehicles
 
         # Ensure order
-        fingerprints["mappingInfos"] = sorted(fingerprints["mappingInfos"], key=lambda v: v["vin"])
+        fingerprints = {
+            "gcid": brand_vehicles.get("gcid"),
+            "mappingInfos": [vehicles[vin] for vin in sorted(vins)],
+        }
 
-        return httpx.Response(200, json=fingerprints)
+        return _json_response(json_dumps(fingerprints))
 
     def vehicle_profile_sideeffect(self, request: httpx.Request) -> httpx.Response:
         """Return /vehicle-data/profile response based on vin."""
-        x_user_agent = request.headers.get("x-user-agent", "").split(";")
-        assert len(x_user_agent) == 4
+        assert len(_split_x_user_agent(request.headers["x-user-agent"])) == 4
 
         try:
-            return httpx.Response(200, json=self.profiles[request.headers["bmw-vin"]])
+            return _json_response(json_dumps(self.profiles[request.headers["bmw-vin"]]))
         except KeyError:
             return httpx.Response(404)
 
     def vehicle_state_sideeffect(self, request: httpx.Request) -> httpx.Response:
         """Return /vehicles response based on x-user-agent."""
-        x_user_agent = request.headers.get("x-user-agent", "").split(";")
-        assert len(x_user_agent) == 4
+        assert len(_split_x_user_agent(request.headers["x-user-agent"])) == 4
 
         try:
-            return httpx.Response(200, json=self.states[request.headers["bmw-vin"]])
+            return _json_response(json_dumps(self.states[request.headers["bmw-vin"]]))
         except KeyError:
             return httpx.Response(404)
 
     def vehicle_charging_settings_sideeffect(self, request: httpx.Request) -> httpx.Response:
         """Return /vehicles response based on x-user-agent."""
-        x_user_agent = request.headers.get("x-user-agent", "").split(";")
-        assert len(x_user_agent) == 4
-        assert "fields" in request.url.params
-        assert "has_charging_settings_capabilities" in request.url.params
+        assert len(_split_x_user_agent(request.headers["x-user-agent"])) == 4
+        assert all(param in request.url.params for param in _CHARGING_SETTINGS_PARAMS)
 
         try:
-            return httpx.Response(200, json=self.charging_settings[request.headers["bmw-vin"]])
+            return _json_response(json_dumps(self.charging_settings[request.headers["bmw-vin"]]))
         except KeyError:
             return httpx.Response(404)
 
@@ -254,14 +302,13 @@ class MyBMWMockRouter(respx.MockRouter):
             # return of REMOTE_SERVICE_RESPONSE_EVENTPOSITION
             pass
 
-        json_data = load_response(REMOTE_SERVICE_RESPONSE_INITIATED)
-        json_data["eventId"] = str(uuid4())
+        json_data = {**load_response(REMOTE_SERVICE_RESPONSE_INITIATED), "eventId": str(uuid4())}
 
-        return httpx.Response(200, json=json_data)
+        return _json_response(json_dumps(json_data))
 
     def charging_settings_sideeffect(self, request: httpx.Request, vin: str) -> httpx.Response:
         """Check if payload is a valid charging settings payload and return evendId."""
-        cs = ChargingSettings(**json.loads(request.content))
+        cs = ChargingSettings(**json_loads(request.content))
 
         # this endpoint allows fields to be omitted, so we have to check for that
         if cs.chargingTarget:
@@ -274,7 +321,7 @@ class MyBMWMockRouter(respx.MockRouter):
     def charging_profile_sideeffect(self, request: httpx.Request, vin: str) -> httpx.Response:
         """Check if payload is a valid charging settings payload and return evendId."""
 
-        data = json.loads(request.content)
+        data = json_loads(request.content)
 
         if {"chargingMode", "departureTimer", "isPreconditionForDepartureActive", "servicePack"} != set(data):
             return httpx.Response(500)
@@ -317,8 +364,8 @@ class MyBMWMockRouter(respx.MockRouter):
     @staticmethod
     def service_status_sideeffect(request: httpx.Request) -> httpx.Response:
         """Return all 3 eventStatus responses per function."""
-        response_data = STATUSREMOTE_SERVICE_RESPONSE_DICT[request.url.params["eventId"]].pop(0)
-        return httpx.Response(200, json=load_response(response_data))
+        response_data = next(STATUSREMOTE_SERVICE_RESPONSE_DICT[request.url.params["eventId"]])
+        return _json_response(_STATUS_JSON[response_data])
 
     @staticmethod
     def poi_sideeffect(request: httpx.Request, gcid: str) -> httpx.Response:
@@ -326,7 +373,7 @@ class MyBMWMockRouter(respx.MockRouter):
 
         assert gcid == "DUMMY"
 
-        data = json.loads(request.content)
+        data = json_loads(request.content)
         tests = all(
             [
                 len(data["vehicleInformation"]["vin"]) == 17,
@@ -1,13 +1,14 @@
 """Fixtures for BMW tests."""
 
 from collections import deque
-from typing import Deque, Generator, Optional
+from typing import Callable, Deque, Generator, Optional, Union
+from unittest import mock
 
 import pytest
-import respx
 
 from bimmer_connected.account import MyBMWAccount
-from bimmer_connected.const import Regions
+from bimmer_connected.api.regions import get_region_from_name
+from bimmer_connected.const import ATTR_ATTRIBUTES, Regions
 from bimmer_connected.models import AnonymizedResponse
 
 from . import (
@@ -22,19 +23,34 @@ from . import (
 from .common import MyBMWMockRouter
 
 
+@pytest.fixture(scope="session")
+def bmw_router() -> MyBMWMockRouter:
+    """Build the MyBMW mock router and its routes once per session."""
+    return MyBMWMockRouter()
+
+
 @pytest.fixture
-def bmw_fixture(request: pytest.FixtureRequest) -> Generator[respx.MockRouter, None, None]:
+def bmw_fixture(request: pytest.FixtureRequest, bmw_router: MyBMWMockRouter) -> Generator[MyBMWMockRouter, None, None]:
     """Patch MyBMW login API calls."""
-    # Now we can start patching the API calls
-    router = MyBMWMockRouter(
+    bmw_router.load_fixtures(
         vehicles_to_load=getattr(request, "param", []),
         profiles=ALL_PROFILES,
         states=ALL_STATES,
         charging_settings=ALL_CHARGING_SETTINGS,
     )
 
-    with router:
-        yield router
+    # Now we can start patching the API calls
+    # respx snapshots the routes on enter, and rolls back all route changes and call stats on exit
+    with bmw_router:
+        yield bmw_router
+
+
+@pytest.fixture
+def no_sleep(monkeypatch: pytest.MonkeyPatch) -> mock.AsyncMock:
+    """Skip waiting in asyncio.sleep, e.g. when retrying after 429 responses."""
+    sleep_mock = mock.AsyncMock()
+    monkeypatch.setattr("asyncio.sleep", sleep_mock)
+    return sleep_mock
 
 
 @pytest.fixture
@@ -54,6 +70,30 @@ def cli_home_dir(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.M
     return tmp_path
 
 
+@pytest.fixture
+def account_factory() -> Callable[..., MyBMWAccount]:
+    """Return a factory for accounts with the test credentials."""
+
+    def _create_account(region: Union[Regions, str] = TEST_REGION, **kwargs) -> MyBMWAccount:
+        if not isinstance(region, Regions):
+            region = get_region_from_name(region)
+        kwargs.setdefault("hcaptcha_token", TEST_CAPTCHA)
+        return MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, region, **kwargs)
+
+    return _create_account
+
+
+@pytest.fixture
+async def account_with_profiles(account_factory: Callable[..., MyBMWAccount]) -> MyBMWAccount:
+    """Return an account with vehicles built from the stored profiles, without logging in."""
+    account = account_factory()
+    for profile in ALL_PROFILES.values():
+        await account.add_vehicle(
+            {ATTR_ATTRIBUTES: {k: v for k, v in profile.items() if k != "vin"}, "vin": profile["vin"]}
+        )
+    return account
+
+
 async def prepare_account_with_vehicles(region: Optional[Regions] = None):
     """Initialize account and get vehicles."""
     account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, region or TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
@@ -1,20 +1,25 @@
 """Tests for MyBMWAccount."""
 
+import contextlib
 import datetime
+import itertools
 import logging
-from pathlib import Path
-from unittest import mock
+import sys
+from collections import Counter
+from typing import Callable, Iterable, Iterator, List, Optional, Type, cast
 
 import httpx
 import pytest
 import respx
+import time_machine
+from pytest_mock import MockerFixture
 
 from bimmer_connected.account import MyBMWAccount
 from bimmer_connected.api.authentication import MyBMWAuthentication, MyBMWLoginRetry
 from bimmer_connected.api.client import MyBMWClient
-from bimmer_connected.api.regions import get_region_from_name
 from bimmer_connected.const import ATTR_CAPABILITIES, VEHICLES_URL, CarBrands, Regions
 from bimmer_connected.models import (
+    AnonymizedResponse,
     GPSPosition,
     MyBMWAPIError,
     MyBMWAuthError,
@@ -23,6 +28,7 @@ from bimmer_connected.models import (
 )
 
 from . import (
+    FINGERPRINT_JSON_COUNT,
     RESPONSE_DIR,
     TEST_CAPTCHA,
     TEST_PASSWORD,
@@ -38,25 +44,20 @@ from .common import MyBMWMockRouter
 from .conftest import prepare_account_with_vehicles
 
 
-@pytest.mark.asyncio
-async def test_login_row(bmw_fixture: respx.Router):
+async def test_login_row(account_factory: Callable[..., MyBMWAccount], bmw_fixture: respx.Router):
     """Test the login flow."""
-    account = MyBMWAccount(
-        TEST_USERNAME, TEST_PASSWORD, get_region_from_name(TEST_REGION_STRING), hcaptcha_token=TEST_CAPTCHA
-    )
+    account = account_factory(TEST_REGION_STRING)
     await account.get_vehicles()
     assert account is not None
 
 
-@pytest.mark.asyncio
-async def test_login_na(bmw_fixture: respx.Router):
+async def test_login_na(account_factory: Callable[..., MyBMWAccount], bmw_fixture: respx.Router):
     """Test the login flow for North America."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, Regions.NORTH_AMERICA, hcaptcha_token=TEST_CAPTCHA)
+    account = account_factory(Regions.NORTH_AMERICA)
     await account.get_vehicles()
     assert account is not None
 
 
-@pytest.mark.asyncio
 async def test_login_na_without_hcaptcha(bmw_fixture: respx.Router):
     """Test the login flow."""
     with pytest.raises(MyBMWCaptchaMissingError):
@@ -64,151 +65,146 @@ async def test_login_na_without_hcaptcha(bmw_fixture: respx.Router):
         await account.get_vehicles()
 
 
-@pytest.mark.asyncio
-async def test_login_refresh_token_row_na_expired(bmw_fixture: respx.Router):
-    """Test the login flow using refresh_token."""
-    with mock.patch("bimmer_connected.api.authentication.EXPIRES_AT_OFFSET", datetime.timedelta(seconds=30000)):
-        account = MyBMWAccount(
-            TEST_USERNAME, TEST_PASSWORD, get_region_from_name(TEST_REGION_STRING), hcaptcha_token=TEST_CAPTCHA
-        )
-        await account.get_vehicles()
-
-        with mock.patch(
-            "bimmer_connected.api.authentication.MyBMWAuthentication._refresh_token_row_na",
-            wraps=account.config.authentication._refresh_token_row_na,
-        ) as mock_listener:
-            mock_listener.reset_mock()
-            await account.get_vehicles()
+AUTH_TOKEN = load_response(RESPONSE_DIR / "auth" / "auth_token.json")
+AUTH_ERROR_WRONG_PASSWORD = load_response(RESPONSE_DIR / "auth" / "auth_error_wrong_password.json")
+AUTH_CN_LOGIN_ERROR = load_response(RESPONSE_DIR / "auth" / "auth_cn_login_error.json")
+AUTH_ERROR_INTERNAL = load_response(RESPONSE_DIR / "auth" / "auth_error_internal_error.txt")
+OAUTH_CONFIG = load_response(RESPONSE_DIR / "auth" / "oauth_config.json")
+VEHICLE_LISTS = {
+    brand: load_response(RESPONSE_DIR / f"{brand.value}-eadrax-vcs_v5_vehicle-list.json") for brand in CarBrands
+}
 
-            # Should not be called at all, as expiry date is not checked anymore
-            assert mock_listener.call_count == 0
-            assert account.config.authentication.refresh_token is not None
+PROFILE_COUNT = get_fingerprint_count("profiles")
+METRIC_UNITS_PREFERENCES = "d=KM;v=L;p=B;ec=KWH100KM;fc=L100KM;em=GKM;"
 
+JSON_429 = {"statusCode": 429, "message": "Rate limit is exceeded. Try again in 2 seconds."}
 
-@pytest.mark.asyncio
-async def test_login_refresh_token_row_na_401(bmw_fixture: respx.Router):
-    """Test the login flow using refresh_token."""
-
-    account = MyBMWAccount(
-        TEST_USERNAME, TEST_PASSWORD, get_region_from_name(TEST_REGION_STRING), hcaptcha_token=TEST_CAPTCHA
-    )
-    await account.get_vehicles()
-
-    with mock.patch(
-        "bimmer_connected.api.authentication.MyBMWAuthentication._refresh_token_row_na",
-        wraps=account.config.authentication._refresh_token_row_na,
-    ) as mock_listener:
-        bmw_fixture.get("/eadrax-vcs/v4/vehicles/state").mock(
-            side_effect=[httpx.Response(401), *([httpx.Response(200, json={ATTR_CAPABILITIES: {}})] * 10)]
-        )
-        mock_listener.reset_mock()
-        await account.get_vehicles()
 
-        assert mock_listener.call_count == 1
-        assert account.config.authentication.refresh_token is not None
+def _response_429() -> httpx.Response:
+    """Return a 429 Too Many Requests response as sent by the API."""
+    return httpx.Response(429, json=JSON_429)
 
 
-@pytest.mark.asyncio
-async def test_login_refresh_token_row_na_invalid(caplog, bmw_fixture: respx.Router):
-    """Test the login flow using refresh_token."""
-    bmw_fixture.post("/gcdm/oauth/token").mock(
-        side_effect=[
-            httpx.Response(400),
-            httpx.Response(200, json=load_response(RESPONSE_DIR / "auth" / "auth_token.json")),
-        ]
+def _after_429(responses: Iterable, n_429: int = 2, with_401: bool = False) -> Iterator:
+    """Return side effects that answer with 429 (and optionally a 401) before the given responses."""
+    return itertools.chain(
+        (_response_429() for _ in range(n_429)), [httpx.Response(401)] if with_401 else [], responses
     )
 
-    account = MyBMWAccount(
-        TEST_USERNAME, TEST_PASSWORD, get_region_from_name(TEST_REGION_STRING), hcaptcha_token=TEST_CAPTCHA
-    )
-    account.set_refresh_token("INVALID")
 
-    caplog.set_level(logging.DEBUG)
-    await account.get_vehicles()
+def _count_logs(records: List[logging.LogRecord], needle: str) -> int:
+    """Count the log records containing a message."""
+    return sum(1 for r in records if needle in r.getMessage())
 
-    debug_messages = [r.message for r in caplog.records if r.name.startswith("bimmer_connected")]
-    assert "Authenticating with refresh token for North America & Rest of World." in debug_messages
-    assert "Unable to get access token using refresh token, falling back to username/password." in debug_messages
-    assert "Authenticating with MyBMW flow for North America & Rest of World." in debug_messages
 
+REFRESH_METHOD_PARAMS = [
+    (TEST_REGION_STRING, "_refresh_token_row_na"),
+    ("china", "_refresh_token_china"),
+]
+REFRESH_TOKEN_PATH_PARAMS = [
+    (TEST_REGION_STRING, "/gcdm/oauth/token", "North America & Rest of World"),
+    ("china", "/eadrax-coas/v2/oauth/token", "China"),
+]
 
-@pytest.mark.asyncio
-async def test_login_china(bmw_fixture: respx.Router):
-    """Test the login flow for region `china`."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, get_region_from_name("china"))
-    await account.get_vehicles()
-    assert account is not None
 
+@pytest.mark.parametrize(("region", "refresh_method"), REFRESH_METHOD_PARAMS)
+async def test_login_refresh_token_expired(
+    account_factory: Callable[..., MyBMWAccount],
+    mocker: MockerFixture,
+    bmw_fixture: respx.Router,
+    region: str,
+    refresh_method: str,
+):
+    """Test the login flow using refresh_token."""
+    account = account_factory(region)
+    await account.get_vehicles()
 
-@pytest.mark.asyncio
-async def test_login_refresh_token_china_expired(bmw_fixture: respx.Router):
-    """Test the login flow using refresh_token  for region `china`."""
-    with mock.patch("bimmer_connected.api.authentication.EXPIRES_AT_OFFSET", datetime.timedelta(seconds=30000)):
-        account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, get_region_from_name("china"))
+    mock_listener = mocker.patch(
+        f"bimmer_connected.api.authentication.MyBMWAuthentication.{refresh_method}",
+        wraps=getattr(account.config.authentication, refresh_method),
+    )
+    # Continue after the access token has expired
+    expires_at = account.config.authentication.expires_at
+    assert expires_at is not None
+    with time_machine.travel(expires_at + datetime.timedelta(hours=1), tick=False):
         await account.get_vehicles()
 
-        with mock.patch(
-            "bimmer_connected.api.authentication.MyBMWAuthentication._refresh_token_china",
-            wraps=account.config.authentication._refresh_token_china,
-        ) as mock_listener:
-            mock_listener.reset_mock()
-            await account.get_vehicles()
-
-            # Should not be called at all, as expiry date is not checked anymore
-            assert mock_listener.call_count == 0
-            assert account.config.authentication.refresh_token is not None
+    # Should not be called at all, as expiry date is not checked anymore
+    assert mock_listener.call_count == 0
+    assert account.config.authentication.refresh_token is not None
 
 
-@pytest.mark.asyncio
-async def test_login_refresh_token_china_401(bmw_fixture: respx.Router):
+@pytest.mark.parametrize(("region", "refresh_method"), REFRESH_METHOD_PARAMS)
+async def test_login_refresh_token_401(
+    account_factory: Callable[..., MyBMWAccount],
+    mocker: MockerFixture,
+    bmw_fixture: respx.Router,
+    region: str,
+    refresh_method: str,
+):
     """Test the login flow using refresh_token."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, get_region_from_name("china"))
+    account = account_factory(region)
     await account.get_vehicles()
 
-    with mock.patch(
-        "bimmer_connected.api.authentication.MyBMWAuthentication._refresh_token_china",
-        wraps=account.config.authentication._refresh_token_china,
-    ) as mock_listener:
-        bmw_fixture.get("/eadrax-vcs/v4/vehicles/state").mock(
-            side_effect=[httpx.Response(401), *([httpx.Response(200, json={ATTR_CAPABILITIES: {}})] * 10)]
+    mock_listener = mocker.patch(
+        f"bimmer_connected.api.authentication.MyBMWAuthentication.{refresh_method}",
+        wraps=getattr(account.config.authentication, refresh_method),
+    )
+    bmw_fixture.routes["state"].mock(
+        side_effect=itertools.chain(
+            [httpx.Response(401)], itertools.repeat(httpx.Response(200, json={ATTR_CAPABILITIES: {}}), 10)
         )
-        mock_listener.reset_mock()
-        await account.get_vehicles()
+    )
+    await account.get_vehicles()
 
-        assert mock_listener.call_count == 1
-        assert account.config.authentication.refresh_token is not None
+    assert mock_listener.call_count == 1
+    assert account.config.authentication.refresh_token is not None
 
 
-@pytest.mark.asyncio
-async def test_login_refresh_token_china_invalid(caplog, bmw_fixture: respx.Router):
+@pytest.mark.parametrize(("region", "token_path", "region_name"), REFRESH_TOKEN_PATH_PARAMS)
+async def test_login_refresh_token_invalid(
+    account_factory: Callable[..., MyBMWAccount],
+    caplog: pytest.LogCaptureFixture,
+    bmw_fixture: respx.Router,
+    region: str,
+    token_path: str,
+    region_name: str,
+):
     """Test the login flow using refresh_token."""
-    bmw_fixture.post("/eadrax-coas/v2/oauth/token").mock(
+    caplog.set_level(logging.DEBUG, logger="bimmer_connected")
+    bmw_fixture.post(token_path).mock(
         side_effect=[
             httpx.Response(400),
-            httpx.Response(200, json=load_response(RESPONSE_DIR / "auth" / "auth_token.json")),
+            httpx.Response(200, json=AUTH_TOKEN),
         ]
     )
 
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, get_region_from_name("china"))
+    account = account_factory(region)
     account.set_refresh_token("INVALID")
 
-    caplog.set_level(logging.DEBUG)
     await account.get_vehicles()
 
-    debug_messages = [r.message for r in caplog.records if r.name.startswith("bimmer_connected")]
-    assert "Authenticating with refresh token for China." in debug_messages
-    assert "Unable to get access token using refresh token, falling back to username/password." in debug_messages
-    assert "Authenticating with MyBMW flow for China." in debug_messages
+    assert {
+        f"Authenticating with refresh token for {region_name}.",
+        "Unable to get access token using refresh token, falling back to username/password.",
+        f"Authenticating with MyBMW flow for {region_name}.",
+    } <= {r.getMessage() for r in caplog.records}
+
 
+async def test_login_china(account_factory: Callable[..., MyBMWAccount], bmw_fixture: respx.Router):
+    """Test the login flow for region `china`."""
+    account = account_factory("china")
+    await account.get_vehicles()
+    assert account is not None
 
-@pytest.mark.asyncio
-async def test_vehicles(bmw_fixture: respx.Router):
+
+async def test_vehicles(account_factory: Callable[..., MyBMWAccount], bmw_fixture: respx.Router):
     """Test the login flow."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, get_region_from_name("china"))
+    account = account_factory("china")
     await account.get_vehicles()
 
     assert account.config.authentication.access_token is not None
-    assert get_fingerprint_count("profiles") == len(account.vehicles)
+    assert len(account.vehicles) == PROFILE_COUNT
 
     vehicle = account.get_vehicle(VIN_G26)
     assert vehicle is not None
@@ -217,191 +213,154 @@ async def test_vehicles(bmw_fixture: respx.Router):
     assert account.get_vehicle("invalid_vin") is None
 
 
-@pytest.mark.asyncio
-async def test_vehicle_init(bmw_fixture: respx.Router):
+async def test_vehicle_init(
+    account_factory: Callable[..., MyBMWAccount], mocker: MockerFixture, bmw_fixture: respx.Router
+):
     """Test vehicle initialization."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
-    with mock.patch(
+    account = account_factory()
+    mock_listener = mocker.patch(
         "bimmer_connected.account.MyBMWAccount._init_vehicles",
         wraps=account._init_vehicles,
-    ) as mock_listener:
-        mock_listener.reset_mock()
+    )
 
-        # First call on init
-        await account.get_vehicles()
-        assert len(account.vehicles) == get_fingerprint_count("profiles")
+    # First call on init
+    await account.get_vehicles()
+    assert len(account.vehicles) == PROFILE_COUNT
 
-        # No call to _init_vehicles()
-        await account.get_vehicles()
-        assert len(account.vehicles) == get_fingerprint_count("profiles")
+    # No call to _init_vehicles()
+    await account.get_vehicles()
+    assert len(account.vehicles) == PROFILE_COUNT
 
-        # Second, forced call _init_vehicles()
-        await account.get_vehicles(force_init=True)
-        assert len(account.vehicles) == get_fingerprint_count("profiles")
+    # Second, forced call _init_vehicles()
+    bmw_fixture.routes["state"].reset()
+    await account.get_vehicles(force_init=True)
+    assert len(account.vehicles) == PROFILE_COUNT
 
-        assert mock_listener.call_count == 2
+    assert mock_listener.call_count == 2
 
+    # State is only requested once per vehicle, even on forced init
+    assert bmw_fixture.routes["state"].call_count == get_fingerprint_count("states")
 
-@pytest.mark.asyncio
-async def test_invalid_password(bmw_fixture: respx.Router):
+
+async def test_invalid_password(account_factory: Callable[..., MyBMWAccount], bmw_fixture: respx.Router):
     """Test parsing the results of an invalid password."""
-    bmw_fixture.post("/gcdm/oauth/authenticate").respond(
-        401, json=load_response(RESPONSE_DIR / "auth" / "auth_error_wrong_password.json")
-    )
+    bmw_fixture.routes["authenticate"].respond(401, json=AUTH_ERROR_WRONG_PASSWORD)
     with pytest.raises(MyBMWAuthError):
-        account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
+        account = account_factory()
         await account.get_vehicles()
 
 
-@pytest.mark.asyncio
-async def test_invalid_password_china(bmw_fixture: respx.Router):
+async def test_invalid_password_china(account_factory: Callable[..., MyBMWAccount], bmw_fixture: respx.Router):
     """Test parsing the results of an invalid password."""
-    bmw_fixture.post("/eadrax-coas/v2/login/pwd").respond(
-        422, json=load_response(RESPONSE_DIR / "auth" / "auth_cn_login_error.json")
-    )
+    bmw_fixture.post("/eadrax-coas/v2/login/pwd").respond(422, json=AUTH_CN_LOGIN_ERROR)
     with pytest.raises(MyBMWAPIError):
-        account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, get_region_from_name("china"))
+        account = account_factory("china")
         await account.get_vehicles()
 
 
-@pytest.mark.asyncio
-async def test_server_error(bmw_fixture: respx.Router):
+async def test_server_error(account_factory: Callable[..., MyBMWAccount], bmw_fixture: respx.Router):
     """Test parsing the results of a server error."""
-    bmw_fixture.post("/gcdm/oauth/authenticate").respond(
-        500, text=load_response(RESPONSE_DIR / "auth" / "auth_error_internal_error.txt")
-    )
+    bmw_fixture.routes["authenticate"].respond(500, text=AUTH_ERROR_INTERNAL)
     with pytest.raises(MyBMWAPIError):
-        account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
+        account = account_factory()
         await account.get_vehicles()
 
 
-@pytest.mark.asyncio
-async def test_vehicle_search_case(bmw_fixture: respx.Router):
+def test_vehicle_search_case(account_with_profiles: MyBMWAccount):
     """Check if the search for the vehicle by VIN is NOT case sensitive."""
-    account = await prepare_account_with_vehicles()
+    account = account_with_profiles
 
     vin = account.vehicles[1].vin
-    assert vin == account.get_vehicle(vin).vin
-    assert vin == account.get_vehicle(vin.lower()).vin
-    assert vin == account.get_vehicle(vin.upper()).vin
+    for search_vin in (vin, vin.lower(), vin.upper()):
+        vehicle = account.get_vehicle(search_vin)
+        assert vehicle is not None
+        assert vehicle.vin == vin
 
 
-@pytest.mark.asyncio
-async def test_get_fingerprints(monkeypatch: pytest.MonkeyPatch, bmw_fixture: respx.Router, bmw_log_all_responses):
+def _count_suffixes(responses: List[AnonymizedResponse]) -> Counter:
+    """Count the stored responses by file suffix in a single pass."""
+    return Counter(response.filename.rsplit(".", 1)[-1] for response in responses)
+
+
+async def test_get_fingerprints(
+    account_factory: Callable[..., MyBMWAccount],
+    monkeypatch: pytest.MonkeyPatch,
+    bmw_fixture: MyBMWMockRouter,
+    bmw_log_all_responses,
+):
     """Test getting fingerprints."""
 
     # Prepare Number of good responses (vehicle profiles + vehicle states, charging settings per vehicle)
     # and 2x vehicle list
-    json_count = (
-        get_fingerprint_count("vehicles")
-        + get_fingerprint_count("profiles")
-        + get_fingerprint_count("states")
-        + get_fingerprint_count("charging_settings")
-    )
+    json_count = FINGERPRINT_JSON_COUNT
 
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA, log_responses=True)
+    account = account_factory(log_responses=True)
     await account.get_vehicles()
 
     # This should have been successful
-    filenames = [Path(f.filename) for f in account.get_stored_responses()]
-    json_files = [f for f in filenames if f.suffix == ".json"]
-    txt_files = [f for f in filenames if f.suffix == ".txt"]
+    suffixes = _count_suffixes(account.get_stored_responses())
 
-    assert len(json_files) == json_count  # all good
-    assert len(txt_files) == 0  # no errors
+    assert suffixes["json"] == json_count  # all good
+    assert suffixes["txt"] == 0  # no errors
 
     # Now we simulate an error for a single vehicle
-    # We need to remove the existing state route first and add it back later as otherwise our error call is never
-    # matched (respx matches by order of routes and we don't replace the existing one)
-    state_route = bmw_fixture.routes.pop("state")
-    bmw_fixture.get("/eadrax-vcs/v4/vehicles/state", headers={"bmw-vin": VIN_G26}).respond(
-        500, text=load_response(RESPONSE_DIR / "auth" / "auth_error_internal_error.txt")
-    )
-    bmw_fixture.routes.add(state_route, "state")
+    with bmw_fixture.routes_before("state"):
+        bmw_fixture.get("/eadrax-vcs/v4/vehicles/state", headers={"bmw-vin": VIN_G26}).respond(
+            500, text=AUTH_ERROR_INTERNAL
+        )
 
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA, log_responses=True)
-    await account.get_vehicles()
+    # Reuse the authenticated account, get_stored_responses() has already emptied the store
+    await account.get_vehicles(force_init=True)
 
-    filenames = [Path(f.filename) for f in account.get_stored_responses()]
-    json_files = [f for f in filenames if f.suffix == ".json"]
-    txt_files = [f for f in filenames if f.suffix == ".txt"]
+    suffixes = _count_suffixes(account.get_stored_responses())
 
-    assert len(json_files) == json_count - 2  # missing on 1 state and 1 charging setting
-    assert len(txt_files) == 1  # error message from state, charging setting was not loaded anymore
+    assert suffixes["json"] == json_count - 2  # missing on 1 state and 1 charging setting
+    assert suffixes["txt"] == 1  # error message from state, charging setting was not loaded anymore
 
 
-@pytest.mark.asyncio
-async def test_set_observer_value(bmw_fixture: respx.Router):
+@pytest.mark.parametrize(("latitude", "longitude"), [(1.0, 2.0), (17.99, 179.9)])
+def test_set_observer_position(account_factory: Callable[..., MyBMWAccount], latitude: float, longitude: float):
     """Test set_observer_position with valid arguments."""
-    account = await prepare_account_with_vehicles()
-
-    account.set_observer_position(1.0, 2.0)
-
-    assert account.config.observer_position == GPSPosition(1.0, 2.0)
-
-
-@pytest.mark.asyncio
-async def test_set_observer_not_set(bmw_fixture: respx.Router):
-    """Test set_observer_position with no arguments."""
-    account = await prepare_account_with_vehicles()
-
+    account = account_factory()
     assert account.config.observer_position is None
 
-    account.set_observer_position(17.99, 179.9)
+    account.set_observer_position(latitude, longitude)
+    assert account.config.observer_position == GPSPosition(latitude, longitude)
 
-    assert account.config.observer_position == GPSPosition(17.99, 179.9)
 
-
-@pytest.mark.asyncio
-async def test_set_observer_invalid_values(bmw_fixture: respx.Router):
-    """Test set_observer_position with invalid arguments."""
-    account = await prepare_account_with_vehicles()
-
-    with pytest.raises(ValueError, match="requires both 'latitude' and 'longitude' set"):
-        account.set_observer_position(1, None)
+@pytest.mark.parametrize(("latitude", "longitude"), [(1.0, None), (None, None)])
+def test_set_observer_position_invalid(
+    account_factory: Callable[..., MyBMWAccount], latitude: Optional[float], longitude: Optional[float]
+):
+    """Test set_observer_position with missing arguments."""
+    account = account_factory()
 
     with pytest.raises(ValueError, match="requires both 'latitude' and 'longitude' set"):
-        account.set_observer_position(None, None)
-
-    account.set_observer_position(1, 2)
-    assert account.config.observer_position == GPSPosition(1.0, 2.0)
+        account.set_observer_position(cast(float, latitude), cast(float, longitude))
+    assert account.config.observer_position is None
 
 
-@pytest.mark.asyncio
-async def test_set_use_metric_units(caplog):
+@pytest.mark.parametrize(
+    ("use_metric_units", "expected_warnings"),
+    [
+        (None, 0),
+        (True, 1),
+        (False, 1),
+    ],
+)
+def test_set_use_metric_units(
+    account_factory: Callable[..., MyBMWAccount], caplog, use_metric_units: Optional[bool], expected_warnings: int
+):
     """Test (deprecated) use_metrics_units flag."""
 
-    # Default
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
-    assert len(caplog.records) == 0
-    metric_client = MyBMWClient(account.config)
-    assert (
-        metric_client.generate_default_header()["bmw-units-preferences"] == "d=KM;v=L;p=B;ec=KWH100KM;fc=L100KM;em=GKM;"
-    )
-
-    # Set to true
-    caplog.clear()
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, use_metric_units=True)
-    assert len(caplog.records) == 1
-    metric_client = MyBMWClient(account.config)
-    assert (
-        metric_client.generate_default_header()["bmw-units-preferences"] == "d=KM;v=L;p=B;ec=KWH100KM;fc=L100KM;em=GKM;"
-    )
-
-    # Set to false
-    caplog.clear()
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, use_metric_units=True)
-    assert len(caplog.records) == 1
-    metric_client = MyBMWClient(account.config)
-    assert (
-        metric_client.generate_default_header()["bmw-units-preferences"] == "d=KM;v=L;p=B;ec=KWH100KM;fc=L100KM;em=GKM;"
-    )
+    account = account_factory(use_metric_units=use_metric_units)
+    assert len(caplog.records) == expected_warnings
+    assert MyBMWClient(account.config).generate_default_header()["bmw-units-preferences"] == METRIC_UNITS_PREFERENCES
 
 
-@pytest.mark.asyncio
-async def test_refresh_token_getset(bmw_fixture: respx.Router):
+async def test_refresh_token_getset(account_factory: Callable[..., MyBMWAccount], bmw_fixture: respx.Router):
     """Test getting/setting the refresh_token and gcid."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
+    account = account_factory()
     assert account.refresh_token is None
     await account.get_vehicles()
     assert account.refresh_token == "another_token_string"
@@ -411,7 +370,7 @@ async def test_refresh_token_getset(bmw_fixture: respx.Router):
     assert account.refresh_token == "new_refresh_token"
     assert account.gcid == "DUMMY"
 
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, get_region_from_name("china"))
+    account = account_factory("china")
     account.set_refresh_token("new_refresh_token", "dummy_gcid")
     assert account.refresh_token == "new_refresh_token"
     assert account.gcid == "dummy_gcid"
@@ -420,316 +379,169 @@ async def test_refresh_token_getset(bmw_fixture: respx.Router):
     assert account.gcid == "DUMMY"
 
 
-@pytest.mark.asyncio
-async def test_429_retry_ok_oauth_config(caplog, bmw_fixture: respx.Router):
-    """Test the login flow using refresh_token."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
-
-    json_429 = {"statusCode": 429, "message": "Rate limit is exceeded. Try again in 2 seconds."}
-
-    bmw_fixture.get("/eadrax-ucs/v1/presentation/oauth/config").mock(
-        side_effect=[
-            httpx.Response(429, json=json_429),
-            httpx.Response(429, json=json_429),
-            httpx.Response(200, json=load_response(RESPONSE_DIR / "auth" / "oauth_config.json")),
-        ]
-    )
-    caplog.set_level(logging.DEBUG)
-
-    with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock):
-        await account.get_vehicles()
-
-    log_429 = [
-        r
-        for r in caplog.records
-        if r.module == "authentication" and "seconds due to 429 Too Many Requests" in r.message
-    ]
-    assert len(log_429) == 2
-
-
-@pytest.mark.asyncio
-async def test_429_retry_raise_oauth_config(caplog, bmw_fixture: respx.Router):
-    """Test the login flow using refresh_token."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
-
-    json_429 = {"statusCode": 429, "message": "Rate limit is exceeded. Try again in 2 seconds."}
-
-    bmw_fixture.get("/eadrax-ucs/v1/presentation/oauth/config").mock(return_value=httpx.Response(429, json=json_429))
-    caplog.set_level(logging.DEBUG)
-
-    with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock), pytest.raises(MyBMWAPIError):
-        await account.get_vehicles()
-
-    log_429 = [
-        r
-        for r in caplog.records
-        if r.module == "authentication" and "seconds due to 429 Too Many Requests" in r.message
-    ]
-    assert len(log_429) == 3
-
-
-@pytest.mark.asyncio
-async def test_429_retry_ok_authenticate(caplog, bmw_fixture: respx.Router):
-    """Test the login flow using refresh_token."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
-
-    json_429 = {"statusCode": 429, "message": "Rate limit is exceeded. Try again in 2 seconds."}
-
-    bmw_fixture.post("/gcdm/oauth/authenticate").mock(
-        side_effect=[
-            httpx.Response(429, json=json_429),
-            httpx.Response(429, json=json_429),
-            MyBMWMockRouter.authenticate_sideeffect,  # type: ignore[list-item]
-            MyBMWMockRouter.authenticate_sideeffect,  # type: ignore[list-item]
-        ]
-    )
-    caplog.set_level(logging.DEBUG)
-
-    with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock):
-        await account.get_vehicles()
-
-    log_429 = [
-        r
-        for r in caplog.records
-        if r.module == "authentication" and "seconds due to 429 Too Many Requests" in r.message
-    ]
-    assert len(log_429) == 2
-
-
-@pytest.mark.asyncio
-async def test_429_retry_raise_authenticate(caplog, bmw_fixture: respx.Router):
-    """Test the login flow using refresh_token."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
-
-    json_429 = {"statusCode": 429, "message": "Rate limit is exceeded. Try again in 2 seconds."}
-
-    bmw_fixture.post("/gcdm/oauth/authenticate").mock(return_value=httpx.Response(429, json=json_429))
-    caplog.set_level(logging.DEBUG)
-
-    with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock), pytest.raises(MyBMWAuthError):
-        await account.get_vehicles()
-
-    log_429 = [
-        r
-        for r in caplog.records
-        if r.module == "authentication" and "seconds due to 429 Too Many Requests" in r.message
-    ]
-    assert len(log_429) == 3
-
-
-@pytest.mark.asyncio
-async def test_429_retry_ok_vehicles(caplog, bmw_fixture: respx.Router):
-    """Test waiting on 429 for vehicles."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
-
-    json_429 = {"statusCode": 429, "message": "Rate limit is exceeded. Try again in 2 seconds."}
-
-    bmw_fixture.post(VEHICLES_URL).mock(
-        side_effect=[
-            httpx.Response(429, json=json_429),
-            httpx.Response(429, json=json_429),
-            *[
-                httpx.Response(200, json=load_response(RESPONSE_DIR / f"{brand.value}-eadrax-vcs_v5_vehicle-list.json"))
-                for brand in CarBrands
-            ],
-        ]
-    )
-    caplog.set_level(logging.DEBUG)
-
-    with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock):
-        await account.get_vehicles()
-
-    log_429 = [
-        r
-        for r in caplog.records
-        if r.module == "authentication" and "seconds due to 429 Too Many Requests" in r.message
-    ]
-    assert len(log_429) == 2
-
-
-@pytest.mark.asyncio
-async def test_429_retry_raise_vehicles(caplog, bmw_fixture: respx.Router):
-    """Test waiting on 429 for vehicles and fail if it happens too often."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
-
-    json_429 = {"statusCode": 429, "message": "Rate limit is exceeded. Try again in 2 seconds."}
-
-    bmw_fixture.post(VEHICLES_URL).mock(return_value=httpx.Response(429, json=json_429))
-    caplog.set_level(logging.DEBUG)
-
-    with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock), pytest.raises(MyBMWQuotaError):
-        await account.get_vehicles()
-
-    log_429 = [
-        r
-        for r in caplog.records
-        if r.module == "authentication" and "seconds due to 429 Too Many Requests" in r.message
-    ]
-    assert len(log_429) == 3
-
-
-@pytest.mark.asyncio
-async def test_429_retry_with_login_ok_vehicles(bmw_fixture: respx.Router):
-    """Test the login flow but experiencing a 429 first."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
-
-    json_429 = {"statusCode": 429, "message": "Rate limit is exceeded. Try again in 2 seconds."}
-
-    bmw_fixture.post(VEHICLES_URL).mock(
-        side_effect=[
-            httpx.Response(429, json=json_429),
-            httpx.Response(429, json=json_429),
-            *[
-                httpx.Response(200, json=load_response(RESPONSE_DIR / f"{brand.value}-eadrax-vcs_v5_vehicle-list.json"))
-                for brand in CarBrands
-            ],
-        ]
-    )
-
-    with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock):
-        await account.get_vehicles()
-
-
-@pytest.mark.asyncio
-async def test_429_retry_with_login_raise_vehicles(bmw_fixture: respx.Router):
-    """Test the error handling, experiencing a 429, 401 and another two 429."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
-
-    json_429 = {"statusCode": 429, "message": "Rate limit is exceeded. Try again in 2 seconds."}
-
-    bmw_fixture.post(VEHICLES_URL).mock(
-        side_effect=[
-            httpx.Response(429, json=json_429),
-            httpx.Response(401),
-            httpx.Response(429, json=json_429),
-            httpx.Response(429, json=json_429),
-            httpx.Response(429, json=json_429),
-            httpx.Response(429, json=json_429),
-            httpx.Response(429, json=json_429),
-        ]
-    )
-
-    with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock), pytest.raises(MyBMWQuotaError):
+@pytest.mark.usefixtures("no_sleep")
+@pytest.mark.parametrize(
+    ("method", "path", "success_responses", "expected_exception", "expected_retries"),
+    [
+        (
+            "GET",
+            "/eadrax-ucs/v1/presentation/oauth/config",
+            [httpx.Response(200, json=OAUTH_CONFIG)],
+            None,
+            2,
+        ),
+        ("GET", "/eadrax-ucs/v1/presentation/oauth/config", None, MyBMWAPIError, 3),
+        (
+            "POST",
+            "/gcdm/oauth/authenticate",
+            [MyBMWMockRouter.authenticate_sideeffect, MyBMWMockRouter.authenticate_sideeffect],
+            None,
+            2,
+        ),
+        ("POST", "/gcdm/oauth/authenticate", None, MyBMWAuthError, 3),
+        (
+            "POST",
+            VEHICLES_URL,
+            [httpx.Response(200, json=VEHICLE_LISTS[brand]) for brand in CarBrands],
+            None,
+            2,
+        ),
+        ("POST", VEHICLES_URL, None, MyBMWQuotaError, 3),
+    ],
+    ids=[
+        "ok_oauth_config",
+        "raise_oauth_config",
+        "ok_authenticate",
+        "raise_authenticate",
+        "ok_vehicles",
+        "raise_vehicles",
+    ],
+)
+async def test_429_retry(
+    account_factory: Callable[..., MyBMWAccount],
+    caplog: pytest.LogCaptureFixture,
+    bmw_fixture: respx.Router,
+    method: str,
+    path: str,
+    success_responses: Optional[List],
+    expected_exception: Optional[Type[Exception]],
+    expected_retries: int,
+):
+    """Test waiting on 429 and recovering, or failing if it happens too often."""
+    caplog.set_level(logging.DEBUG, logger="bimmer_connected")
+    account = account_factory()
+
+    if success_responses:
+        bmw_fixture.request(method, path).mock(side_effect=_after_429(success_responses))
+    else:
+        bmw_fixture.request(method, path).mock(return_value=_response_429())
+
+    with pytest.raises(expected_exception) if expected_exception else contextlib.nullcontext():
         await account.get_vehicles()
 
+    assert _count_logs(caplog.records, "seconds due to 429 Too Many Requests") == expected_retries
 
-@pytest.mark.asyncio
-async def test_multiple_401(bmw_fixture: respx.Router):
-    """Test the error handling, when multiple 401 are received in sequence."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
 
-    bmw_fixture.post(VEHICLES_URL).mock(
+@pytest.mark.usefixtures("no_sleep")
+@pytest.mark.parametrize(
+    ("status_codes", "expected_exception"),
+    [
+        ([429, 401, 429, 429, 429, 429, 429], MyBMWQuotaError),
+        ([401, 401], MyBMWAuthError),
+        ([429, 429, 429, 401, 429], MyBMWQuotaError),
+    ],
+    ids=["429_with_login", "multiple_401", "401_after_429"],
+)
+async def test_vehicles_error_sequence(
+    account_factory: Callable[..., MyBMWAccount],
+    bmw_fixture: respx.Router,
+    status_codes: List[int],
+    expected_exception: Type[Exception],
+):
+    """Test the error handling for sequences of 429 and 401 responses on the vehicle list."""
+    account = account_factory()
+
+    bmw_fixture.routes["vehicles"].mock(
         side_effect=[
-            httpx.Response(401),
-            httpx.Response(401),
+            _response_429() if status_code == 429 else httpx.Response(status_code) for status_code in status_codes
         ]
     )
 
-    with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock), pytest.raises(MyBMWAuthError):
+    with pytest.raises(expected_exception):
         await account.get_vehicles()
 
 
-@pytest.mark.asyncio
-async def test_401_after_429_ok(bmw_fixture: respx.Router):
+@pytest.mark.usefixtures("no_sleep")
+async def test_401_after_429_ok(account_factory: Callable[..., MyBMWAccount], bmw_fixture: respx.Router):
     """Test the error handling, when a 401 is received after exactly 3 429."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
+    account = account_factory()
     await account.get_vehicles()
 
-    json_429 = {"statusCode": 429, "message": "Rate limit is exceeded. Try again in 2 seconds."}
-
     # Recover after 3 429 and 1 401
-    bmw_fixture.post(VEHICLES_URL).mock(
-        side_effect=[
-            httpx.Response(429, json=json_429),
-            httpx.Response(429, json=json_429),
-            httpx.Response(429, json=json_429),
-            httpx.Response(401),
-            # Just simulate OK responses from now on
-            *[httpx.Response(200, json=load_response(RESPONSE_DIR / "bmw-eadrax-vcs_v5_vehicle-list.json"))] * 100,
-        ]
-    )
-    with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock):
-        await account.get_vehicles()
-    assert len(account.vehicles) == get_fingerprint_count("profiles")
-
-
-@pytest.mark.asyncio
-async def test_401_after_429_fail(bmw_fixture: respx.Router):
-    """Test the error handling, when a 401 is received after exactly 3 429."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
-
-    json_429 = {"statusCode": 429, "message": "Rate limit is exceeded. Try again in 2 seconds."}
-
-    # Fail after 3 429 and 1 401 with another 429
-    bmw_fixture.post(VEHICLES_URL).mock(
-        side_effect=[
-            httpx.Response(429, json=json_429),
-            httpx.Response(429, json=json_429),
-            httpx.Response(429, json=json_429),
-            httpx.Response(401),
-            httpx.Response(429, json=json_429),
-        ]
+    vehicles_route = bmw_fixture.routes["vehicles"]
+    vehicles_route.reset()
+    vehicles_route.mock(
+        side_effect=_after_429(
+            # Just simulate OK responses from now on, one vehicle list per brand
+            itertools.repeat(httpx.Response(200, json=VEHICLE_LISTS[CarBrands.BMW]), len(CarBrands)),
+            n_429=3,
+            with_401=True,
+        )
     )
-
-    with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock), pytest.raises(MyBMWQuotaError):
-        await account.get_vehicles()
+    await account.get_vehicles(force_init=True)
+    assert vehicles_route.call_count == 4 + len(CarBrands)
+    assert len(account.vehicles) == PROFILE_COUNT
 
 
-@pytest.mark.asyncio
-async def test_403_quota_exceeded_vehicles_usa(caplog, bmw_fixture: respx.Router):
+@pytest.mark.usefixtures("no_sleep")
+async def test_403_quota_exceeded_vehicles_usa(
+    account_factory: Callable[..., MyBMWAccount], caplog: pytest.LogCaptureFixture, bmw_fixture: respx.Router
+):
     """Test 403 quota issues for vehicle state and fail if it happens too often."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
+    caplog.set_level(logging.DEBUG, logger="bimmer_connected")
+    account = account_factory()
     # get vehicles once
     await account.get_vehicles()
 
-    bmw_fixture.get("/eadrax-vcs/v4/vehicles/state").mock(
+    bmw_fixture.routes["state"].mock(
         return_value=httpx.Response(
             403,
             json={"statusCode": 403, "message": "Out of call volume quota. Quota will be replenished in 02:12:20."},
         )
     )
-    caplog.set_level(logging.DEBUG)
 
-    with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock), pytest.raises(MyBMWQuotaError):
+    with pytest.raises(MyBMWQuotaError):
         await account.get_vehicles()
 
-    log_quota = [r for r in caplog.records if "quota" in r.message]
-    assert len(log_quota) == 1
+    assert _count_logs(caplog.records, "quota") == 1
 
 
-@pytest.mark.asyncio
-async def test_incomplete_vehicle_details(caplog, bmw_fixture: respx.Router):
+async def test_incomplete_vehicle_details(caplog: pytest.LogCaptureFixture, bmw_fixture: MyBMWMockRouter):
     """Test incorrect responses for vehicle details."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
-    # get vehicles once
-    await account.get_vehicles()
+    caplog.set_level(logging.DEBUG, logger="bimmer_connected")
+    account = await prepare_account_with_vehicles()
 
-    # We need to remove the existing state route first and add it back later as otherwise our error call is never
-    # matched (respx matches by order of routes and we don't replace the existing one)
-    state_route = bmw_fixture.routes.pop("state")
-    # JSON, but error
-    bmw_fixture.get("/eadrax-vcs/v4/vehicles/state", headers={"bmw-vin": VIN_I20}).respond(
-        500, json={"statusCode": 500, "message": "Something is broken."}
-    )
-    # No JSON
-    bmw_fixture.get("/eadrax-vcs/v4/vehicles/state", headers={"bmw-vin": VIN_G26}).respond(
-        500, text=load_response(RESPONSE_DIR / "auth" / "auth_error_internal_error.txt")
-    )
-    bmw_fixture.routes.add(state_route, "state")
+    with bmw_fixture.routes_before("state"):
+        # JSON, but error
+        bmw_fixture.get("/eadrax-vcs/v4/vehicles/state", headers={"bmw-vin": VIN_I20}).respond(
+            500, json={"statusCode": 500, "message": "Something is broken."}
+        )
+        # No JSON
+        bmw_fixture.get("/eadrax-vcs/v4/vehicles/state", headers={"bmw-vin": VIN_G26}).respond(
+            500, text=AUTH_ERROR_INTERNAL
+        )
 
     await account.get_vehicles()
 
-    log_error = [r for r in caplog.records if "Unable to get details" in r.message]
-    assert len(log_error) == 2
+    assert _count_logs(caplog.records, "Unable to get details") == 2
 
 
-@pytest.mark.asyncio
-async def test_no_vehicle_details(caplog, bmw_fixture: respx.Router):
+async def test_no_vehicle_details(caplog: pytest.LogCaptureFixture, bmw_fixture: respx.Router):
     """Test raising an exception if no responses for vehicle details are received."""
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA)
-    await account.get_vehicles()
+    caplog.set_level(logging.DEBUG, logger="bimmer_connected")
+    account = await prepare_account_with_vehicles()
 
-    bmw_fixture.get("/eadrax-vcs/v4/vehicles/state").mock(
+    bmw_fixture.routes["state"].mock(
         return_value=httpx.Response(
             500,
             json={"statusCode": 500, "message": "Something is broken."},
@@ -738,11 +550,9 @@ async def test_no_vehicle_details(caplog, bmw_fixture: respx.Router):
     with pytest.raises(MyBMWAPIError):
         await account.get_vehicles()
 
-    log_error = [r for r in caplog.records if "Unable to get details" in r.message]
-    assert len(log_error) == get_fingerprint_count("profiles")
+    assert _count_logs(caplog.records, "Unable to get details") == PROFILE_COUNT
 
 
-@pytest.mark.asyncio
 async def test_client_async_only(bmw_fixture: respx.Router):
     """Test that the Authentication providers only work async."""
 
@@ -755,26 +565,40 @@ async def test_client_async_only(bmw_fixture: respx.Router):
         client.get("/eadrax-ucs/v1/presentation/oauth/config")
 
 
-@pytest.mark.asyncio
-async def test_pillow_unavailable(monkeypatch: pytest.MonkeyPatch, bmw_fixture: respx.Router):
+@pytest.mark.parametrize(
+    ("region_name", "should_raise"),
+    [
+        ("china", True),
+        ("rest_of_world", False),
+        ("north_america", False),
+    ],
+)
+async def test_pillow_unavailable(
+    account_factory: Callable[..., MyBMWAccount],
+    monkeypatch: pytest.MonkeyPatch,
+    bmw_fixture: respx.Router,
+    region_name: str,
+    should_raise: bool,
+):
     """Test cases if Pillow is unavailable (i.e. lib is not installed with extra [china])."""
 
-    monkeypatch.setattr("importlib.import_module", mock.Mock(side_effect=ImportError))
+    # Only block Pillow, other dynamic imports during the test must keep working
+    monkeypatch.setitem(sys.modules, "PIL", None)
+    monkeypatch.setitem(sys.modules, "PIL.Image", None)
 
-    # Test china (needs to throw exception)
-    account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, get_region_from_name("china"))
-    with pytest.raises(
-        expected_exception=ImportError,
-        match=r"Missing dependencies for region 'china'. Please install using bimmerconnected\[china\].",
-    ):
-        await account.get_vehicles()
-    assert account is not None
-    assert len(account.vehicles) == 0
+    account = account_factory(region_name)
 
-    # But rest_of_world and north_america should work
-    account = MyBMWAccount(
-        TEST_USERNAME, TEST_PASSWORD, get_region_from_name("rest_of_world"), hcaptcha_token=TEST_CAPTCHA
-    )
-    await account.get_vehicles()
-    assert account is not None
-    assert len(account.vehicles) > 0
+    # China needs to throw an exception, but rest_of_world and north_america should work
+    if should_raise:
+        with pytest.raises(
+            expected_exception=ImportError,
+            match=r"Missing dependencies for region 'china'. Please install using bimmerconnected\[china\].",
+        ) as excinfo:
+            await account.get_vehicles()
+        # The failure must come from the blocked Pillow import itself
+        assert isinstance(excinfo.value.__cause__, ModuleNotFoundError)
+        assert excinfo.value.__cause__.name == "PIL.Image"
+        assert len(account.vehicles) == 0
+    else:
+        await account.get_vehicles()
+        assert len(account.vehicles) > 0
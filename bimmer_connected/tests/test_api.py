@@ -1,6 +1,8 @@
 """Tests for API that are not covered by other tests."""
 
 import json
+import ssl
+from typing import Any, Dict
 
 import httpx
 import pytest
@@ -8,20 +10,25 @@ import respx
 
 from bimmer_connected.account import MyBMWAccount
 from bimmer_connected.api.authentication import get_retry_wait_time
+from bimmer_connected.api.client import RESPONSE_STORE
 from bimmer_connected.api.regions import get_region_from_name, valid_regions
-from bimmer_connected.api.utils import anonymize_data
+from bimmer_connected.api.utils import anonymize_data, get_ssl_context
+from bimmer_connected.models import AnonymizedResponse
 from bimmer_connected.utils import log_response_store_to_file
 
 from . import (
+    FINGERPRINT_JSON_COUNT,
     RESPONSE_DIR,
     TEST_CAPTCHA,
     TEST_PASSWORD,
     TEST_REGION,
     TEST_USERNAME,
     VIN_G26,
-    get_fingerprint_count,
     load_response,
 )
+from .common import MyBMWMockRouter
+
+AUTH_ERROR_INTERNAL = load_response(RESPONSE_DIR / "auth" / "auth_error_internal_error.txt")
 
 
 def test_valid_regions():
@@ -55,6 +62,7 @@ def test_anonymize_data():
         ],
         "b_list": ["a", "b"],
         "empty_list": [],
+        "nested_lists": [[{"vin": "WBA000000SECRET02", "street": "secret"}], []],
     }
     anon_text = json.dumps(anonymize_data(test_dict))
     assert "SECRET" not in anon_text
@@ -64,17 +72,13 @@ def test_anonymize_data():
     assert "more_public_data" in anon_text
 
 
-@pytest.mark.asyncio
-async def test_storing_fingerprints(tmp_path, bmw_fixture: respx.Router, bmw_log_all_responses):
+async def test_storing_fingerprints(tmp_path, bmw_fixture: MyBMWMockRouter, bmw_log_all_responses):
     """Test storing fingerprints to file."""
 
-    # We need to remove the existing state route first and add it back later as otherwise our error call is never
-    # matched (respx matches by order of routes and we don't replace the existing one)
-    state_route = bmw_fixture.routes.pop("state")
-    bmw_fixture.get("/eadrax-vcs/v4/vehicles/state", headers={"bmw-vin": VIN_G26}).respond(
-        500, text=load_response(RESPONSE_DIR / "auth" / "auth_error_internal_error.txt")
-    )
-    bmw_fixture.routes.add(state_route, "state")
+    with bmw_fixture.routes_before("state"):
+        bmw_fixture.get("/eadrax-vcs/v4/vehicles/state", headers={"bmw-vin": VIN_G26}).respond(
+            500, text=AUTH_ERROR_INTERNAL
+        )
 
     account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA, log_responses=True)
     await account.get_vehicles()
@@ -86,28 +90,35 @@ async def test_storing_fingerprints(tmp_path, bmw_fixture: respx.Router, bmw_log
     txt_files = [f for f in files if f.suffix == ".txt"]
 
     assert len(json_files) == (
-        get_fingerprint_count("vehicles")
-        + get_fingerprint_count("profiles")
-        + get_fingerprint_count("states")
+        FINGERPRINT_JSON_COUNT
         - 1  # state with error 500
-        + get_fingerprint_count("charging_settings")
-        - 1  # not loaded due to state with error 500
+        - 1  # charging settings not loaded due to state with error 500
     )
     assert len(txt_files) == 1  # state with error 500
 
 
-@pytest.mark.asyncio
-async def test_fingerprint_deque(monkeypatch: pytest.MonkeyPatch, bmw_fixture: respx.Router):
+def test_storing_fingerprints_same_filename(tmp_path):
+    """Test that the last of several responses with the same filename is stored."""
+
+    log_response_store_to_file(
+        [
+            AnonymizedResponse("bmw-eadrax-vcs_v5_vehicle-list.json", {"statusCode": 429}),
+            AnonymizedResponse("bmw-eadrax-vcs_v5_vehicle-list.json", {"mappingInfos": []}),
+        ],
+        tmp_path,
+    )
+
+    assert json.loads((tmp_path / "bmw-eadrax-vcs_v5_vehicle-list.json").read_text()) == {"mappingInfos": []}
+
+
+async def test_fingerprint_deque(bmw_fixture: respx.Router):
     """Test storing fingerprints to file."""
-    # Prepare Number of good responses
 
     account = MyBMWAccount(TEST_USERNAME, TEST_PASSWORD, TEST_REGION, hcaptcha_token=TEST_CAPTCHA, log_responses=True)
-    await account.get_vehicles()
-    await account.get_vehicles()
 
-    # More than 10 calls were made, but only last 10 are stored
-    assert len([c for c in bmw_fixture.calls if c.request.url.path.startswith("/eadrax-vcs")]) > 10
-    assert len(account.get_stored_responses()) == 10
+    # More than 10 responses were stored, but only last 10 are kept
+    RESPONSE_STORE.extend(AnonymizedResponse(f"response_{i}.json") for i in range(15))
+    assert [r.filename for r in account.get_stored_responses()] == [f"response_{i}.json" for i in range(5, 15)]
 
     # Stored responses are reset
     account.config.set_log_responses(False)
@@ -123,17 +134,25 @@ async def test_fingerprint_deque(monkeypatch: pytest.MonkeyPatch, bmw_fixture: r
     assert len(account.get_stored_responses()) == 10
 
 
-def test_get_retry_wait_time():
-    """Test extraction of retry wait time."""
+def test_get_ssl_context():
+    """Test that the default SSL context is shared and explicit settings are kept."""
+    assert isinstance(get_ssl_context(True), ssl.SSLContext)
+    assert get_ssl_context(True) is get_ssl_context(True)
 
-    # Parsing correctly
-    r = httpx.Response(429, json={"statusCode": 429, "message": "Rate limit is exceeded. Try again in 1 seconds."})
-    assert get_retry_wait_time(r) == 2
+    custom_context = ssl.create_default_context()
+    assert get_ssl_context(custom_context) is custom_context
+    assert get_ssl_context(False) is False
 
-    # No number found
-    r = httpx.Response(429, json={"statusCode": 429, "message": "Rate limit is exceeded."})
-    assert get_retry_wait_time(r) == 4
 
-    # No JSON response
-    r = httpx.Response(429, text="Rate limit is exceeded.")
-    assert get_retry_wait_time(r) == 4
+@pytest.mark.parametrize(
+    ("response_kwargs", "expected_wait_time"),
+    [
+        ({"json": {"statusCode": 429, "message": "Rate limit is exceeded. Try again in 1 seconds."}}, 2),
+        ({"json": {"statusCode": 429, "message": "Rate limit is exceeded."}}, 4),
+        ({"text": "Rate limit is exceeded."}, 4),
+    ],
+    ids=["parsing_correctly", "no_number_found", "no_json_response"],
+)
+def test_get_retry_wait_time(response_kwargs: Dict[str, Any], expected_wait_time: int):
+    """Test extraction of retry wait time."""
+    assert get_retry_wait_time(httpx.Response(429, **response_kwargs)) == expected_wait_time
@@ -1,9 +1,15 @@
 import contextlib
+import importlib.metadata
+import itertools
 import json
-import subprocess
+import logging
+import os
+import runpy
 import sys
 import time
+from collections import Counter
 from pathlib import Path
+from typing import Generator, List
 
 import httpx
 import pytest
@@ -13,27 +19,67 @@ import time_machine
 import bimmer_connected.cli
 from bimmer_connected import __version__ as VERSION
 
-from . import RESPONSE_DIR, get_fingerprint_count, load_response
+from . import FINGERPRINT_JSON_COUNT, RESPONSE_DIR, get_fingerprint_count, json_loads, load_response
 
 ARGS_USER_PW_REGION = ["--captcha-token", "P1_eY...", "myuser", "mypassword", "rest_of_world"]
 FIXTURE_CLI_HELP = "Connect to MyBMW/MINI API and interact with your vehicle."
+AUTH_ERROR_WRONG_PASSWORD = load_response(RESPONSE_DIR / "auth" / "auth_error_wrong_password.json")
+AUTH_TOKEN = load_response(RESPONSE_DIR / "auth" / "auth_token.json")
+OAUTH_STORE_KEYS = {"access_token", "refresh_token", "gcid", "session_id", "session_id_timestamp"}
+# Stored session_id_timestamps in the OAuth tests are relative to this time
+OAUTH_STORE_TIME = "2021-11-28 21:28:59 +0000"
 
 
-def test_run_entrypoint():
+@pytest.fixture(autouse=True)
+def restore_argv(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Restore sys.argv after each test so tests sharing a worker process stay independent."""
+    monkeypatch.setattr(sys, "argv", list(sys.argv))
+
+
+@pytest.fixture(autouse=True)
+def restore_root_logger() -> Generator[None, None, None]:
+    """Remove handlers added by `--debug` so they don't leak into other tests on the same worker."""
+    root_logger = logging.getLogger()
+    handlers, level = list(root_logger.handlers), root_logger.level
+    yield
+    for handler in root_logger.handlers[:]:
+        if handler not in handlers:
+            root_logger.removeHandler(handler)
+    root_logger.setLevel(level)
+
+
+def _vin_lines(output: str) -> List[str]:
+    """Return the lines of the status text output that start a vehicle."""
+    return [line for line in output.splitlines() if line.startswith("VIN: ")]
+
+
+def test_run_entrypoint(capsys: pytest.CaptureFixture):
     """Test if the entrypoint is installed correctly."""
-    result = subprocess.run(["bimmerconnected", "--help"], capture_output=True, text=True)
+    entry_point = next(
+        ep for ep in importlib.metadata.distribution("bimmer_connected").entry_points if ep.group == "console_scripts"
+    )
+    assert entry_point.name == "bimmerconnected"
+
+    sys.argv = ["bimmerconnected", "--help"]
+    with pytest.raises(SystemExit) as excinfo:
+        entry_point.load()()
 
-    assert FIXTURE_CLI_HELP in result.stdout
-    assert result.returncode == 0
+    assert FIXTURE_CLI_HELP in capsys.readouterr().out
+    assert excinfo.value.code == 0
 
 
-def test_run_module():
+def test_run_module(capsys: pytest.CaptureFixture, monkeypatch: pytest.MonkeyPatch):
     """Test if the module can be run as a python module."""
-    result = subprocess.run(["python", "-m", "bimmer_connected.cli", "--help"], capture_output=True, text=True)
+    # Run it like `python -m`, which would warn if the module was already imported
+    monkeypatch.delitem(sys.modules, "bimmer_connected.cli")
+    sys.argv = ["bimmer_connected.cli", "--help"]
+    with pytest.raises(SystemExit) as excinfo:
+        runpy.run_module("bimmer_connected.cli", run_name="__main__")
 
-    assert FIXTURE_CLI_HELP in result.stdout
-    assert VERSION in result.stdout
-    assert result.returncode == 0
+    result = capsys.readouterr()
+    assert FIXTURE_CLI_HELP in result.out
+    assert VERSION in result.out
+    assert excinfo.value.code == 0
 
 
 @pytest.mark.usefixtures("bmw_fixture")
@@ -55,7 +101,7 @@ def test_status_json_filtered(capsys: pytest.CaptureFixture, vin, expected_count
     result = capsys.readouterr()
 
     if expected_count == 1:
-        result_json = json.loads(result.out)
+        result_json = json_loads(result.out)
         assert isinstance(result_json, dict)
         assert result_json["vin"] == vin
     else:
@@ -71,7 +117,7 @@ def test_status_json_unfiltered(capsys: pytest.CaptureFixture):
     bimmer_connected.cli.main()
     result = capsys.readouterr()
 
-    result_json = json.loads(result.out)
+    result_json = json_loads(result.out)
     assert isinstance(result_json, list)
     assert len(result_json) == get_fingerprint_count("states")
 
@@ -96,11 +142,10 @@ def test_status_filtered(capsys: pytest.CaptureFixture, vin, expected_count):
 
     assert f"Found {get_fingerprint_count('states')} vehicles" in result.out
 
+    vin_lines = _vin_lines(result.out)
+    assert len(vin_lines) == expected_count
     if expected_count == 1:
-        assert f"VIN: {vin}" in result.out
-        assert result.out.count("VIN: ") == expected_count
-    else:
-        assert result.out.count("VIN: ") == expected_count
+        assert vin_lines == [f"VIN: {vin}"]
 
 
 @pytest.mark.usefixtures("bmw_fixture")
@@ -113,7 +158,7 @@ def test_status_unfiltered(capsys: pytest.CaptureFixture):
     result = capsys.readouterr()
 
     assert f"Found {get_fingerprint_count('states')} vehicles" in result.out
-    assert result.out.count("VIN: ") == get_fingerprint_count("states")
+    assert len(_vin_lines(result.out)) == get_fingerprint_count("states")
 
 
 @pytest.mark.usefixtures("bmw_fixture")
@@ -127,17 +172,12 @@ def test_fingerprint(capsys: pytest.CaptureFixture, cli_home_dir: Path):
 
     assert "fingerprint of the vehicles written to" in result.out
 
-    files = list((cli_home_dir / "vehicle_fingerprint").rglob("*"))
-    json_files = [f for f in files if f.suffix == ".json"]
-    txt_files = [f for f in files if f.suffix == ".txt"]
-
-    assert len(json_files) == (
-        get_fingerprint_count("vehicles")
-        + get_fingerprint_count("profiles")
-        + get_fingerprint_count("states")
-        + get_fingerprint_count("charging_settings")
+    suffixes = Counter(
+        os.path.splitext(name)[1] for _, _, names in os.walk(cli_home_dir / "vehicle_fingerprint") for name in names
     )
-    assert len(txt_files) == 0
+
+    assert suffixes[".json"] == FINGERPRINT_JSON_COUNT
+    assert suffixes[".txt"] == 0
 
 
 @pytest.mark.usefixtures("cli_home_dir")
@@ -153,12 +193,12 @@ def test_oauth_store_credentials(cli_home_dir: Path, bmw_fixture: respx.Router):
     assert bmw_fixture.routes["vehicles"].calls[0].request.headers["authorization"] == "Bearer some_token_string"
 
     assert (cli_home_dir / ".bimmer_connected.json").exists() is True
-    oauth_storage = json.loads((cli_home_dir / ".bimmer_connected.json").read_text())
+    oauth_storage = json_loads((cli_home_dir / ".bimmer_connected.json").read_bytes())
 
-    assert set(oauth_storage.keys()) == {"access_token", "refresh_token", "gcid", "session_id", "session_id_timestamp"}
+    assert oauth_storage.keys() == OAUTH_STORE_KEYS
 
 
-@time_machine.travel("2021-11-28 21:28:59 +0000")
+@time_machine.travel(OAUTH_STORE_TIME)
 @pytest.mark.usefixtures("cli_home_dir")
 def test_oauth_load_credentials(cli_home_dir: Path, bmw_fixture: respx.Router):
     """Test loading and storing the oauth credentials."""
@@ -183,18 +223,13 @@ def test_oauth_load_credentials(cli_home_dir: Path, bmw_fixture: respx.Router):
     assert bmw_fixture.routes["vehicles"].calls[0].request.headers["bmw-session-id"] == "demo_session_id"
 
     assert (cli_home_dir / ".bimmer_connected.json").exists() is True
-    oauth_storage = json.loads((cli_home_dir / ".bimmer_connected.json").read_text())
+    oauth_storage = json_loads((cli_home_dir / ".bimmer_connected.json").read_bytes())
 
-    assert set(oauth_storage.keys()) == {"access_token", "refresh_token", "gcid", "session_id", "session_id_timestamp"}
+    # no change as the old tokens and session_id are still valid
+    assert oauth_storage == demo_oauth_data
 
-    # no change as the old tokens are still valid
-    assert oauth_storage["refresh_token"] == demo_oauth_data["refresh_token"]
-    assert oauth_storage["access_token"] == demo_oauth_data["access_token"]
-    assert oauth_storage["gcid"] == demo_oauth_data["gcid"]
-    assert oauth_storage["session_id"] == demo_oauth_data["session_id"]
 
-
-@time_machine.travel("2021-11-28 21:28:59 +0000")
+@time_machine.travel(OAUTH_STORE_TIME)
 @pytest.mark.usefixtures("cli_home_dir")
 def test_oauth_load_credentials_old_session_id(cli_home_dir: Path, bmw_fixture: respx.Router):
     """Test loading and storing the oauth credentials and getting a new session_id."""
@@ -215,7 +250,7 @@ def test_oauth_load_credentials_old_session_id(cli_home_dir: Path, bmw_fixture:
     bimmer_connected.cli.main()
 
     assert (cli_home_dir / ".bimmer_connected.json").exists() is True
-    oauth_storage = json.loads((cli_home_dir / ".bimmer_connected.json").read_text())
+    oauth_storage = json_loads((cli_home_dir / ".bimmer_connected.json").read_bytes())
 
     # no change as the old tokens are still valid
     assert oauth_storage["refresh_token"] == demo_oauth_data["refresh_token"]
@@ -226,7 +261,7 @@ def test_oauth_load_credentials_old_session_id(cli_home_dir: Path, bmw_fixture:
     assert oauth_storage["session_id_timestamp"] == pytest.approx(time.time(), abs=5)
 
 
-@time_machine.travel("2021-11-28 21:28:59 +0000")
+@time_machine.travel(OAUTH_STORE_TIME)
 @pytest.mark.usefixtures("cli_home_dir")
 def test_oauth_store_credentials_on_error(cli_home_dir: Path, bmw_fixture: respx.Router):
     """Test loading and storing the oauth credentials, even if a call errors out."""
@@ -242,11 +277,11 @@ def test_oauth_store_credentials_on_error(cli_home_dir: Path, bmw_fixture: respx
     (cli_home_dir / ".bimmer_connected.json").write_text(json.dumps(demo_oauth_data))
     assert (cli_home_dir / ".bimmer_connected.json").exists() is True
 
-    vehicle_routes = bmw_fixture.pop("vehicles")
-    bmw_fixture.post("/eadrax-vcs/v5/vehicle-list", name="vehicles").mock(
+    vehicles_route = bmw_fixture.routes["vehicles"]
+    vehicles_route.mock(
         side_effect=[
-            httpx.Response(401, json=load_response(RESPONSE_DIR / "auth" / "auth_error_wrong_password.json")),
-            vehicle_routes.side_effect,  # type: ignore[list-item]
+            httpx.Response(401, json=AUTH_ERROR_WRONG_PASSWORD),
+            vehicles_route.side_effect,  # type: ignore[list-item]
             httpx.Response(500),
         ]
     )
@@ -259,7 +294,7 @@ def test_oauth_store_credentials_on_error(cli_home_dir: Path, bmw_fixture: respx
 
     # Check that tokens are stored and a new refresh_token is saved
     assert (cli_home_dir / ".bimmer_connected.json").exists() is True
-    oauth_storage = json.loads((cli_home_dir / ".bimmer_connected.json").read_text())
+    oauth_storage = json_loads((cli_home_dir / ".bimmer_connected.json").read_bytes())
     assert oauth_storage["refresh_token"] == "another_token_string"
     assert oauth_storage["access_token"] == "some_token_string"
     assert oauth_storage["gcid"] == demo_oauth_data["gcid"]
@@ -295,9 +330,9 @@ def test_oauth_store_credentials_path(cli_home_dir: Path, tmp_path_factory: pyte
     assert (cli_home_dir / ".bimmer_connected.json").exists() is False
     assert (new_folder / filepath).exists() is True
 
-    oauth_storage = json.loads((new_folder / filepath).read_text())
+    oauth_storage = json_loads((new_folder / filepath).read_bytes())
 
-    assert set(oauth_storage.keys()) == {"access_token", "refresh_token", "gcid", "session_id", "session_id_timestamp"}
+    assert oauth_storage.keys() == OAUTH_STORE_KEYS
 
 
 @pytest.mark.usefixtures("bmw_fixture")
@@ -327,12 +362,12 @@ def test_login_refresh_token(cli_home_dir: Path, bmw_fixture: respx.Router):
     (cli_home_dir / ".bimmer_connected.json").write_text(json.dumps(demo_oauth_data))
     assert (cli_home_dir / ".bimmer_connected.json").exists() is True
 
-    vehicle_routes = bmw_fixture.pop("vehicles")
-    bmw_fixture.post("/eadrax-vcs/v5/vehicle-list", name="vehicles").mock(
-        side_effect=[
-            httpx.Response(401, json=load_response(RESPONSE_DIR / "auth" / "auth_error_wrong_password.json")),
-            *[vehicle_routes.side_effect for _ in range(1000)],  # type: ignore[list-item]
-        ]
+    vehicles_route = bmw_fixture.routes["vehicles"]
+    vehicles_route.mock(
+        side_effect=itertools.chain(
+            [httpx.Response(401, json=AUTH_ERROR_WRONG_PASSWORD)],
+            itertools.repeat(vehicles_route.side_effect, 1000),  # type: ignore[arg-type]
+        )
     )
 
     sys.argv = ["bimmerconnected", "--debug", "status", *ARGS_USER_PW_REGION]
@@ -360,11 +395,11 @@ def test_login_invalid_refresh_token(cli_home_dir: Path, bmw_fixture: respx.Rout
     (cli_home_dir / ".bimmer_connected.json").write_text(json.dumps(demo_oauth_data))
     assert (cli_home_dir / ".bimmer_connected.json").exists() is True
 
-    bmw_fixture.post("/gcdm/oauth/token", name="token").mock(
-        side_effect=[
-            httpx.Response(401, json=load_response(RESPONSE_DIR / "auth" / "auth_error_wrong_password.json")),
-            *[httpx.Response(200, json=load_response(RESPONSE_DIR / "auth" / "auth_token.json")) for _ in range(1000)],
-        ]
+    bmw_fixture.routes["token"].mock(
+        side_effect=itertools.chain(
+            [httpx.Response(401, json=AUTH_ERROR_WRONG_PASSWORD)],
+            (httpx.Response(200, json=AUTH_TOKEN) for _ in range(1000)),
+        )
     )
 
     sys.argv = ["bimmerconnected", "status", *ARGS_USER_PW_REGION]
@@ -387,7 +422,7 @@ def test_captcha_set(capsys: pytest.CaptureFixture):
     bimmer_connected.cli.main()
     result = capsys.readouterr()
 
-    result_json = json.loads(result.out)
+    result_json = json_loads(result.out)
     assert isinstance(result_json, list)
     assert len(result_json) == get_fingerprint_count("states")
 
@@ -65,7 +65,6 @@ ALL_SERVICES = {
 }
 
 
-@pytest.mark.asyncio
 @pytest.mark.filterwarnings("ignore:coroutine 'AsyncMockMixin._execute_mock_call' was never awaited:RuntimeWarning")
 async def test_trigger_remote_services(bmw_fixture: respx.Router):
     """Test executing a remote light flash."""
@@ -77,8 +76,6 @@ async def test_trigger_remote_services(bmw_fixture: respx.Router):
         with mock.patch(
             "bimmer_connected.account.MyBMWAccount.get_vehicles", new_callable=mock.AsyncMock
         ) as mock_listener:
-            mock_listener.reset_mock()
-
             response = await getattr(vehicle.remote_services, service["call"])(  # type: ignore[call-overload]
                 *service.get("args", []), **service.get("kwargs", {})
             )
@@ -90,7 +87,6 @@ async def test_trigger_remote_services(bmw_fixture: respx.Router):
                 mock_listener.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_get_remote_service_status(bmw_fixture: respx.Router):
     """Test get_remove_service_status method."""
 
@@ -114,7 +110,20 @@ async def test_get_remote_service_status(bmw_fixture: respx.Router):
         await vehicle.remote_services._block_until_done(client, uuid4())
 
 
-@pytest.mark.asyncio
+async def test_remote_service_correlation_ids(bmw_fixture: respx.Router):
+    """Test that each status poll of a remote service gets its own correlation ID."""
+
+    account = await prepare_account_with_vehicles()
+    vehicle = account.get_vehicle(VIN_G26)
+    call_count = len(bmw_fixture.calls)
+
+    await vehicle.remote_services.trigger_remote_light_flash()
+
+    correlation_ids = [call.request.headers["x-correlation-id"] for call in bmw_fixture.calls[call_count:]]
+    assert len(correlation_ids) > 2  # trigger and status polls
+    assert len(set(correlation_ids)) == len(correlation_ids)
+
+
 async def test_set_lock_result(bmw_fixture: respx.Router):
     """Test locking/unlocking a car."""
 
@@ -131,7 +140,6 @@ async def test_set_lock_result(bmw_fixture: respx.Router):
     assert vehicle.doors_and_windows.door_lock_state == LockState.UNLOCKED
 
 
-@pytest.mark.asyncio
 async def test_set_climate_result(bmw_fixture: respx.Router):
     """Test starting/stopping climatization."""
 
@@ -148,7 +156,6 @@ async def test_set_climate_result(bmw_fixture: respx.Router):
     assert vehicle.climate.activity == ClimateActivityState.STANDBY
 
 
-@pytest.mark.asyncio
 async def test_charging_start_stop(bmw_fixture: respx.Router):
     """Test starting/stopping climatization."""
 
@@ -166,7 +173,6 @@ async def test_charging_start_stop(bmw_fixture: respx.Router):
     assert vehicle.fuel_and_battery.charging_status == ChargingState.CHARGING
 
 
-@pytest.mark.asyncio
 async def test_set_charging_settings(bmw_fixture: respx.Router):
     """Test setting the charging settings on a car."""
 
@@ -206,7 +212,6 @@ async def test_set_charging_settings(bmw_fixture: respx.Router):
         await vehicle.remote_services.trigger_charging_settings_update(ac_limit="asdf")
 
 
-@pytest.mark.asyncio
 async def test_set_charging_profile(bmw_fixture: respx.Router, monkeypatch: pytest.MonkeyPatch):
     """Test setting the charging profile on a car."""
 
@@ -244,7 +249,6 @@ async def test_set_charging_profile(bmw_fixture: respx.Router, monkeypatch: pyte
     assert vehicle.charging_profile.charging_mode == ChargingMode.IMMEDIATE_CHARGING
 
 
-@pytest.mark.asyncio
 async def test_vehicles_without_enabled_services(bmw_fixture: respx.Router):
     """Test setting the charging profile on a car."""
 
@@ -268,7 +272,6 @@ async def test_vehicles_without_enabled_services(bmw_fixture: respx.Router):
                 )
 
 
-@pytest.mark.asyncio
 async def test_trigger_charge_start_stop_warnings(caplog, bmw_fixture: respx.Router):
     """Test if warnings are produced correctly with the charge start/stop services."""
 
@@ -305,7 +308,6 @@ async def test_trigger_charge_start_stop_warnings(caplog, bmw_fixture: respx.Rou
     caplog.clear()
 
 
-@pytest.mark.asyncio
 async def test_get_remote_position(bmw_fixture: respx.Router):
     """Test getting position from remote service."""
 
@@ -329,7 +331,6 @@ async def test_get_remote_position(bmw_fixture: respx.Router):
     assert location.heading == 121
 
 
-@pytest.mark.asyncio
 async def test_get_remote_position_fail_without_observer(caplog, bmw_fixture: respx.Router):
     """Test getting position from remote service."""
 
@@ -346,7 +347,6 @@ async def test_get_remote_position_fail_without_observer(caplog, bmw_fixture: re
     assert len(errors) == 1
 
 
-@pytest.mark.asyncio
 async def test_fail_with_timeout(monkeypatch: pytest.MonkeyPatch, bmw_fixture: respx.Router):
     """Test failing after timeout was reached."""
 
@@ -362,7 +362,6 @@ async def test_fail_with_timeout(monkeypatch: pytest.MonkeyPatch, bmw_fixture: r
 
 
 # @time_machine.travel("2020-01-01")
-@pytest.mark.asyncio
 async def test_get_remote_position_too_old(bmw_fixture: respx.Router):
     """Test remote service position being ignored as vehicle status is newer."""
 
@@ -381,7 +380,6 @@ async def test_get_remote_position_too_old(bmw_fixture: respx.Router):
     assert location.heading == 180
 
 
-@pytest.mark.asyncio
 async def test_poi(bmw_fixture: respx.Router):
     """Test get_remove_service_status method."""
 
@@ -8,7 +8,6 @@ try:
 except ImportError:
     from backports import zoneinfo  # type: ignore[import, no-redef]
 
-import pytest
 import respx
 
 from bimmer_connected.api.utils import get_capture_position
@@ -19,7 +18,6 @@ from . import RESPONSE_DIR, VIN_G26, load_response
 from .conftest import prepare_account_with_vehicles
 
 
-@pytest.mark.asyncio
 async def test_drive_train(bmw_fixture: respx.Router):
     """Tests available attribute."""
     vehicle = (await prepare_account_with_vehicles()).get_vehicle(VIN_G26)
@@ -65,6 +63,17 @@ def test_parse_datetime(caplog):
 
     assert dt_without_milliseconds == parse_datetime("2021-11-12T16:14:15+03:00")
 
+    assert dt_without_milliseconds == parse_datetime("2021-11-12T16:14:15.5+0300")
+
+    # Timestamps without timezone are not supported
+    assert parse_datetime("2021-11-12T13:14:15") is None
+
+    # Other ISO 8601 variants are not supported, independent of the Python version
+    assert parse_datetime("2021-11-12 13:14:15Z") is None
+    assert parse_datetime("20211112T131415Z") is None
+    assert parse_datetime("2021-W45-5T13:14:15Z") is None
+    assert parse_datetime("2021-11-12T13:14Z") is None
+
     unparseable_datetime = "2021-14-12T13:14:15Z"
     assert parse_datetime(unparseable_datetime) is None
     errors = [r for r in caplog.records if r.levelname == "ERROR" and unparseable_datetime in r.message]
@@ -1,5 +1,6 @@
 """Tests for MyBMWVehicle."""
 
+import httpx
 import pytest
 import respx
 
@@ -10,6 +11,7 @@ from bimmer_connected.vehicle.const import DriveTrainType
 from bimmer_connected.vehicle.reports import CheckControlMessageReport
 
 from . import (
+    ALL_STATES,
     VIN_F31,
     VIN_G01,
     VIN_G20,
@@ -21,6 +23,7 @@ from . import (
     VIN_J29,
     get_deprecation_warning_count,
 )
+from .common import MyBMWMockRouter
 from .conftest import prepare_account_with_vehicles
 
 ATTRIBUTE_MAPPING = {
@@ -41,7 +44,6 @@ ATTRIBUTE_MAPPING = {
 }
 
 
-@pytest.mark.asyncio
 async def test_drive_train(caplog, bmw_fixture: respx.Router):
     """Tests around drive_train attribute."""
     account = await prepare_account_with_vehicles()
@@ -60,10 +62,9 @@ async def test_drive_train(caplog, bmw_fixture: respx.Router):
     vehicle = account.get_vehicle(VIN_I01_REX)
     assert vehicle.drive_train == DriveTrainType.ELECTRIC_WITH_RANGE_EXTENDER
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_parsing_attributes(caplog, bmw_fixture: respx.Router):
     """Test parsing different attributes of the vehicle."""
     account = await prepare_account_with_vehicles()
@@ -78,10 +79,9 @@ async def test_parsing_attributes(caplog, bmw_fixture: respx.Router):
         assert vehicle.drive_train_attributes is not None
         assert vehicle.is_charging_plan_supported is not None
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_drive_train_attributes(caplog, bmw_fixture: respx.Router):
     """Test parsing different attributes of the vehicle."""
     account = await prepare_account_with_vehicles()
@@ -102,10 +102,9 @@ async def test_drive_train_attributes(caplog, bmw_fixture: respx.Router):
         assert vehicle_drivetrains[vehicle.vin][0] == vehicle.has_combustion_drivetrain
         assert vehicle_drivetrains[vehicle.vin][1] == vehicle.has_electric_drivetrain
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_parsing_of_lsc_type(caplog, bmw_fixture: respx.Router):
     """Test parsing the lsc type field."""
     account = await prepare_account_with_vehicles()
@@ -113,7 +112,7 @@ async def test_parsing_of_lsc_type(caplog, bmw_fixture: respx.Router):
     for vehicle in account.vehicles:
         assert vehicle.lsc_type is not None
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
 def test_car_brand(caplog, bmw_fixture: respx.Router):
@@ -123,10 +122,9 @@ def test_car_brand(caplog, bmw_fixture: respx.Router):
     with pytest.raises(ValueError):
         CarBrands("Audi")
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_get_is_tracking_enabled(caplog, bmw_fixture: respx.Router):
     """Test setting observer position."""
     account = await prepare_account_with_vehicles()
@@ -136,10 +134,9 @@ async def test_get_is_tracking_enabled(caplog, bmw_fixture: respx.Router):
     vehicle = account.get_vehicle(VIN_G20)
     assert vehicle.is_vehicle_tracking_enabled is True
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_available_attributes(caplog, bmw_fixture: respx.Router):
     """Check that available_attributes returns exactly the arguments we have in our test data."""
     account = await prepare_account_with_vehicles()
@@ -206,10 +203,9 @@ async def test_available_attributes(caplog, bmw_fixture: respx.Router):
         "windows",
     ]
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_vehicle_image(caplog, bmw_fixture: respx.Router):
     """Test vehicle image request."""
     vehicle = (await prepare_account_with_vehicles()).get_vehicle(VIN_G01)
@@ -221,10 +217,9 @@ async def test_vehicle_image(caplog, bmw_fixture: respx.Router):
     ).respond(200, content="png_image")
     assert await vehicle.get_vehicle_image(VehicleViewDirection.FRONT) == b"png_image"
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_no_timestamp(bmw_fixture: respx.Router):
     """Test no timestamp available."""
     vehicle = (await prepare_account_with_vehicles()).get_vehicle(VIN_F31)
@@ -234,6 +229,49 @@ async def test_no_timestamp(bmw_fixture: respx.Router):
     assert vehicle.timestamp is None
 
 
+async def test_no_lsc_supported(bmw_fixture: respx.Router):
+    """Test vehicle state without LastStateCall information."""
+    vehicle = (await prepare_account_with_vehicles()).get_vehicle(VIN_G26)
+    vehicle.data[ATTR_STATE].pop("isLscSupported", None)
+
+    assert vehicle.is_lsc_enabled is False
+    assert vehicle.available_attributes == ["gps_position", "vin"]
+
+
+async def test_vehicle_state_not_modified(bmw_fixture: MyBMWMockRouter):
+    """Test conditional requests for the vehicle state."""
+    vehicle = (await prepare_account_with_vehicles()).get_vehicle(VIN_G26)
+    mileage = vehicle.mileage
+
+    with bmw_fixture.routes_before("state"):
+        etag_route = bmw_fixture.get("/eadrax-vcs/v4/vehicles/state", headers={"bmw-vin": VIN_G26}).mock(
+            side_effect=[
+                httpx.Response(200, json=ALL_STATES[VIN_G26], headers={"etag": '"state-etag"'}),
+                httpx.Response(304),
+            ]
+        )
+
+    await vehicle.get_vehicle_state()
+    assert "if-none-match" not in etag_route.calls.last.request.headers
+
+    await vehicle.get_vehicle_state()
+    assert etag_route.calls.last.request.headers["if-none-match"] == '"state-etag"'
+    assert vehicle.mileage == mileage
+    assert vehicle.fuel_and_battery.remaining_battery_percent is not None
+
+
+async def test_vehicle_state_correlation_ids(bmw_fixture: MyBMWMockRouter):
+    """Test that each vehicle state request gets its own correlation ID."""
+    vehicle = (await prepare_account_with_vehicles()).get_vehicle(VIN_G26)
+    call_count = len(bmw_fixture.calls)
+
+    await vehicle.get_vehicle_state()
+
+    correlation_ids = [call.request.headers["x-correlation-id"] for call in bmw_fixture.calls[call_count:]]
+    assert len(correlation_ids) == 2  # state and charging settings
+    assert len(set(correlation_ids)) == len(correlation_ids)
+
+
 def test_strenum(caplog):
     """Tests StrEnum."""
 
@@ -303,7 +341,6 @@ def test_gpsposition():
         GPSPosition(90, 181)
 
 
-@pytest.mark.asyncio
 async def test_headunit_data(caplog, bmw_fixture: respx.Router):
     """Test if the parsing of headunit is working."""
 
@@ -319,4 +356,4 @@ async def test_headunit_data(caplog, bmw_fixture: respx.Router):
     assert status.headunit_type == "NBT"
     assert status.software_version == "11/2013.02"
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
@@ -33,7 +33,6 @@ from .conftest import prepare_account_with_vehicles
 UTC = datetime.timezone.utc
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("bmw_fixture", [[VIN_G26]], indirect=True)
 async def test_generic(caplog, bmw_fixture: respx.Router):
     """Test generic attributes."""
@@ -45,10 +44,9 @@ async def test_generic(caplog, bmw_fixture: respx.Router):
     assert status.mileage[0] == 1121
     assert status.mileage[1] == "km"
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_generic_error_handling(caplog, bmw_fixture: respx.Router):
     """Test error handling when vehicle is set up."""
     account = await prepare_account_with_vehicles()
@@ -69,7 +67,6 @@ async def test_generic_error_handling(caplog, bmw_fixture: respx.Router):
     caplog.clear()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("vin"),
     [
@@ -91,10 +88,9 @@ async def test_range_combustion_no_info(caplog, bmw_fixture: respx.Router, vin:
 
     assert status.remaining_range_total == (None, None)
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_range_combustion(caplog, bmw_fixture: respx.Router):
     """Test if the parsing of mileage and range is working."""
     vehicle = (await prepare_account_with_vehicles()).get_vehicle(VIN_G20)
@@ -113,10 +109,9 @@ async def test_range_combustion(caplog, bmw_fixture: respx.Router):
     assert status_from_vehicle_data == status
     assert FuelAndBattery.from_vehicle_data({}) is None
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_range_phev(caplog, bmw_fixture: respx.Router):
     """Test if the parsing of mileage and range is working."""
     status = (await prepare_account_with_vehicles()).get_vehicle(VIN_G01).fuel_and_battery
@@ -132,10 +127,9 @@ async def test_range_phev(caplog, bmw_fixture: respx.Router):
 
     assert status.remaining_range_fuel[0] + status.remaining_range_electric[0] == status.remaining_range_total[0]
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_range_rex(caplog, bmw_fixture: respx.Router):
     """Test if the parsing of mileage and range is working."""
     status = (await prepare_account_with_vehicles()).get_vehicle(VIN_I01_REX).fuel_and_battery
@@ -151,10 +145,9 @@ async def test_range_rex(caplog, bmw_fixture: respx.Router):
 
     assert status.remaining_range_fuel[0] + status.remaining_range_electric[0] == status.remaining_range_total[0]
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_range_electric(caplog, bmw_fixture: respx.Router):
     """Test if the parsing of mileage and range is working."""
     status = (await prepare_account_with_vehicles()).get_vehicle(VIN_I20).fuel_and_battery
@@ -168,11 +161,10 @@ async def test_range_electric(caplog, bmw_fixture: respx.Router):
 
     assert status.remaining_range_total == (340, "km")
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
 @time_machine.travel("2021-11-28 21:28:59 +0000")
-@pytest.mark.asyncio
 async def test_charging_end_time(caplog, bmw_fixture: respx.Router):
     """Test charging end time."""
     account = await prepare_account_with_vehicles()
@@ -183,11 +175,10 @@ async def test_charging_end_time(caplog, bmw_fixture: respx.Router):
     assert vehicle.fuel_and_battery.is_charger_connected is True
     assert vehicle.fuel_and_battery.charging_start_time is None
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
 @time_machine.travel("2021-11-28 17:28:59 +0000")
-@pytest.mark.asyncio
 async def test_plugged_in_waiting_for_charge_window(caplog, bmw_fixture: respx.Router):
     """I01_REX is plugged in but not charging, as its waiting for charging window."""
 
@@ -204,10 +195,9 @@ async def test_plugged_in_waiting_for_charge_window(caplog, bmw_fixture: respx.R
     assert vehicle.fuel_and_battery.charging_start_time == datetime.datetime(2021, 11, 29, 18, 1)
     assert vehicle.fuel_and_battery.charging_target == 100
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_condition_based_services(caplog, bmw_fixture: respx.Router):
     """Test condition based service messages."""
     vehicle = (await prepare_account_with_vehicles()).get_vehicle(VIN_G26)
@@ -231,10 +221,9 @@ async def test_condition_based_services(caplog, bmw_fixture: respx.Router):
 
     assert vehicle.condition_based_services.is_service_required is False
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_position_generic(caplog, bmw_fixture: respx.Router):
     """Test generic attributes."""
     status = (await prepare_account_with_vehicles()).get_vehicle(VIN_G26)
@@ -246,10 +235,9 @@ async def test_position_generic(caplog, bmw_fixture: respx.Router):
 
     assert VehicleLocation.from_vehicle_data({}) is None
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_vehicle_active(caplog, bmw_fixture: respx.Router):
     """Test that vehicle_active is always False."""
     account = await prepare_account_with_vehicles()
@@ -257,10 +245,9 @@ async def test_vehicle_active(caplog, bmw_fixture: respx.Router):
     for vehicle in account.vehicles:
         assert vehicle.is_vehicle_active is False
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_parse_f31_no_position(caplog, bmw_fixture: respx.Router):
     """Test parsing of F31 data with position tracking disabled in the vehicle."""
     vehicle = (await prepare_account_with_vehicles()).get_vehicle(VIN_F31)
@@ -268,10 +255,9 @@ async def test_parse_f31_no_position(caplog, bmw_fixture: respx.Router):
     assert vehicle.vehicle_location.location is None
     assert vehicle.vehicle_location.heading is None
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_parse_gcj02_position(caplog, bmw_fixture: respx.Router):
     """Test conversion of GCJ02 to WGS84 for china."""
     account = await prepare_account_with_vehicles(get_region_from_name("china"))
@@ -298,10 +284,9 @@ async def test_parse_gcj02_position(caplog, bmw_fixture: respx.Router):
         round(vehicle.vehicle_location.location[1], 5),
     ) == (39.8337, 116.22617)
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_lids(caplog, bmw_fixture: respx.Router):
     """Test features around lids."""
     # status = (await prepare_account_with_vehicles()).get_vehicle(VIN_G01).doors_and_windows
@@ -326,10 +311,9 @@ async def test_lids(caplog, bmw_fixture: respx.Router):
 
     assert status.lids[-1].name == "sunRoof"
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_windows_g01(caplog, bmw_fixture: respx.Router):
     """Test features around windows."""
     status = (await prepare_account_with_vehicles()).get_vehicle(VIN_G01).doors_and_windows
@@ -341,10 +325,9 @@ async def test_windows_g01(caplog, bmw_fixture: respx.Router):
     assert len(list(status.open_windows)) == 0
     assert status.all_windows_closed is True
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_door_locks(caplog, bmw_fixture: respx.Router):
     """Test the door locks."""
     status = (await prepare_account_with_vehicles()).get_vehicle(VIN_G01).doors_and_windows
@@ -355,10 +338,9 @@ async def test_door_locks(caplog, bmw_fixture: respx.Router):
 
     assert status.door_lock_state == LockState.UNLOCKED
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_check_control_messages(caplog, bmw_fixture: respx.Router):
     """Test handling of check control messages.
 
@@ -385,10 +367,9 @@ async def test_check_control_messages(caplog, bmw_fixture: respx.Router):
     assert ccms[1].description_short == "ENGINE_OIL"
     assert None is ccms[1].description_long
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_charging_profile(caplog, bmw_fixture: respx.Router):
     """Test parsing of the charging profile."""
 
@@ -413,10 +394,9 @@ async def test_charging_profile(caplog, bmw_fixture: respx.Router):
     assert charging_settings.ac_current_limit == 16
     assert charging_settings.ac_available_limits == [6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 20, 32]
 
-    assert len(get_deprecation_warning_count(caplog)) == 0
+    assert get_deprecation_warning_count(caplog) == 0
 
 
-@pytest.mark.asyncio
 async def test_charging_profile_format_for_remote_service(caplog, bmw_fixture: respx.Router):
     """Test formatting of the charging profile."""
     account = await prepare_account_with_vehicles()
@@ -439,7 +419,6 @@ async def test_charging_profile_format_for_remote_service(caplog, bmw_fixture: r
         assert vehicle.charging_profile.format_for_remote_service() == fixture_data
 
 
-@pytest.mark.asyncio
 async def test_tires(bmw_fixture: respx.Router):
     """Test tire status."""
     account = await prepare_account_with_vehicles()
@@ -470,7 +449,6 @@ async def test_tires(bmw_fixture: respx.Router):
 
 
 @time_machine.travel("2021-11-28 21:28:59 +0000")
-@pytest.mark.asyncio
 async def test_climate(bmw_fixture: respx.Router):
     """Test climate status."""
     account = await prepare_account_with_vehicles()
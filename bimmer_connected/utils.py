@@ -5,9 +5,11 @@ import inspect
 import json
 import logging
 import pathlib
+import re
 import time
 from enum import Enum
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
 
 from bimmer_connected.models import AnonymizedResponse
 
@@ -22,20 +24,38 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
-JSON_IGNORED_KEYS = ["account", "_account", "vehicle", "_vehicle", "status", "remote_services"]
+JSON_IGNORED_KEYS = ["account", "_account", "vehicle", "_vehicle", "status", "remote_services", "_state_etag"]
 
+DATE_FORMATS = ["%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ"]
+# Shape of the DATE_FORMATS above, so the `fromisoformat` fast path doesn't accept more on newer Python versions
+RE_DATE_FORMATS = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{1,6})?(Z|[+-]\d{2}:?\d{2})")
 
-def get_class_property_names(obj: object):
+
+def get_class_property_names(obj: Any):
     """Return the names of all properties of a class."""
-    return [p[0] for p in inspect.getmembers(type(obj), inspect.isdatadescriptor) if not p[0].startswith("_")]
+    return list(_get_property_names(obj.__class__))
+
+
+@lru_cache(maxsize=None)
+def _get_property_names(cls: Type[Any]) -> Tuple[str, ...]:
+    """Return the names of all properties of a class, cached per class."""
+    return tuple(p[0] for p in inspect.getmembers(cls, inspect.isdatadescriptor) if not p[0].startswith("_"))
 
 
 def parse_datetime(date_str: str) -> Optional[datetime.datetime]:
     """Convert a time string into datetime."""
     if not date_str:
         return None
-    date_formats = ["%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ"]
-    for date_format in date_formats:
+
+    # Fast path for ISO 8601 strings with timezone. `fromisoformat` only supports the `Z` suffix in >=3.11.
+    if RE_DATE_FORMATS.fullmatch(date_str):
+        try:
+            parsed = datetime.datetime.fromisoformat(f"{date_str[:-1]}+00:00" if date_str.endswith("Z") else date_str)
+            return parsed.replace(microsecond=0).astimezone(datetime.timezone.utc)
+        except ValueError:
+            pass
+
+    for date_format in DATE_FORMATS:
         try:
             # Parse datetimes using `time.strptime` to allow running in some embedded python interpreters.
             # Only fixed in >=3.12: https://github.com/python/cpython/issues/71587
@@ -47,7 +67,7 @@ def parse_datetime(date_str: str) -> Optional[datetime.datetime]:
             return parsed
         except ValueError:
             pass
-    _LOGGER.error("unable to parse '%s' using %s", date_str, date_formats)
+    _LOGGER.error("unable to parse '%s' using %s", date_str, DATE_FORMATS)
     return None
 
 
@@ -89,15 +109,24 @@ def to_camel_case(input_str: str) -> str:
     return retval
 
 
+def _log_response_to_file(response: AnonymizedResponse, logfile_path: pathlib.Path) -> None:
+    """Log a single response to a file."""
+    output_path = logfile_path / response.filename
+    content = response.content
+
+    if output_path.suffix == ".json" or not isinstance(content, str):
+        # Serialize in one go, as json.dump() would issue a write for every chunk
+        text = json.dumps(content or [], indent=4, sort_keys=True)
+    else:
+        text = content or "NO CONTENT"
+
+    with open(output_path, "w", encoding="UTF-8") as logfile:
+        logfile.write(text)
+
+
 def log_response_store_to_file(response_store: List[AnonymizedResponse], logfile_path: pathlib.Path) -> None:
     """Log all responses to files."""
 
+    # Write sequentially, so the last of several responses with the same filename wins
     for response in response_store:
-        output_path = logfile_path / response.filename
-        content = response.content
-
-        with open(output_path, "w", encoding="UTF-8") as logfile:
-            if output_path.suffix == ".json" or not isinstance(content, str):
-                json.dump(content or [], logfile, indent=4, sort_keys=True)
-            else:
-                logfile.write(content or "NO CONTENT")
+        _log_response_to_file(response, logfile_path)
@@ -7,6 +7,7 @@ import logging
 from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 from bimmer_connected.api.client import MyBMWClient
+from bimmer_connected.api.utils import get_correlation_id
 from bimmer_connected.const import (
     REMOTE_SERVICE_POSITION_URL,
     REMOTE_SERVICE_STATUS_URL,
@@ -146,8 +147,8 @@ class RemoteServices:
 
         _LOGGER.debug("getting remote service status for '%s'", event_id)
         url = REMOTE_SERVICE_STATUS_URL.format(vin=self._vehicle.vin, event_id=event_id)
-        async with MyBMWClient(self._account.config, brand=self._vehicle.brand) as client:
-            response = await client.post(url)
+        # Re-use the client (and its open connection) of the triggered service, but with a new correlation ID
+        response = await client.post(url, headers=get_correlation_id())
         return RemoteServiceStatus(response.json(), event_id=event_id)
 
     async def _block_until_done(self, client: MyBMWClient, event_id: str) -> RemoteServiceStatus:
@@ -5,6 +5,7 @@ import logging
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type, Union
 
 from bimmer_connected.api.client import MyBMWClient
+from bimmer_connected.api.utils import get_correlation_id
 from bimmer_connected.const import (
     ATTR_ATTRIBUTES,
     ATTR_CAPABILITIES,
@@ -34,6 +35,22 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+#: Top-level keys that are always present in the combined vehicle data
+_VEHICLE_DATA_KEYS = (ATTR_ATTRIBUTES, ATTR_CAPABILITIES, ATTR_STATE, ATTR_CHARGING_SETTINGS)
+
+#: Data classes and the vehicle attributes they are stored in, updated on every state refresh
+_VEHICLE_DATA_ENTITIES: Tuple[Tuple[Type["VehicleDataBase"], str], ...] = (
+    (FuelAndBattery, "fuel_and_battery"),
+    (VehicleLocation, "vehicle_location"),
+    (DoorsAndWindows, "doors_and_windows"),
+    (ConditionBasedServiceReport, "condition_based_services"),
+    (CheckControlMessageReport, "check_control_messages"),
+    (Headunit, "headunit"),
+    (Climate, "climate"),
+    (ChargingProfile, "charging_profile"),
+    (Tires, "tires"),
+)
+
 
 class VehicleViewDirection(StrEnum):
     """Viewing angles for the vehicle.
@@ -94,29 +111,36 @@ class MyBMWVehicle:
         self.climate: Climate = Climate()
         self.charging_profile: Optional[ChargingProfile] = None
         self.tires: Optional[Tires] = None
+        self._state_etag: Optional[str] = None
 
         self.data = self.combine_data(vehicle_base, fetched_at=fetched_at)
 
     async def get_vehicle_state(self) -> None:
         """Retrieve vehicle data from BMW servers."""
-        _LOGGER.debug("Getting vehicle list")
+        _LOGGER.debug("Getting vehicle state for %s", self.vin)
 
         fetched_at = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
 
-        async with MyBMWClient(self.account.config) as client:
-            # Get state details
+        # Default headers (incl. brand) are set on the client, each request gets its own correlation ID and the VIN
+        async with MyBMWClient(self.account.config, brand=self.brand) as client:
+            # Get state details, using a conditional request if the server provided an ETag before
+            state_headers = {**get_correlation_id(), "bmw-vin": self.vin}
+            if self._state_etag:
+                state_headers["if-none-match"] = self._state_etag
             state_response = await client.get(
                 VEHICLE_STATE_URL,
                 params={
                     "apptimezone": 0,
                     "appDateTime": int(fetched_at.timestamp() * 1000),
                 },
-                headers={
-                    **client.generate_default_header(self.brand),
-                    "bmw-vin": self.vin,
-                },
+                headers=state_headers,
             )
-            vehicle_state: Dict = state_response.json()
+
+            # 304 Not Modified: state is unchanged, so skip decoding and keep the existing data
+            vehicle_state: Dict = {}
+            if state_response.status_code != 304:
+                vehicle_state = state_response.json()
+                self._state_etag = state_response.headers.get("etag")
 
             # If vehicle has not been initialized with capabilities from state, do it once
             if not self.data.get(ATTR_CAPABILITIES):
@@ -132,7 +156,7 @@ class MyBMWVehicle:
                         "has_charging_settings_capabilities": self.is_charging_settings_supported,
                     },
                     headers={
-                        **client.generate_default_header(self.brand),
+                        **get_correlation_id(),
                         "bmw-current-date": fetched_at.isoformat(),
                         "bmw-vin": self.vin,
                     },
@@ -150,23 +174,12 @@ class MyBMWVehicle:
         vehicle_data = self.combine_data(data, fetched_at)
         self.data = vehicle_data
 
-        update_entities: List[Tuple[Type[VehicleDataBase], str]] = [
-            (FuelAndBattery, "fuel_and_battery"),
-            (VehicleLocation, "vehicle_location"),
-            (DoorsAndWindows, "doors_and_windows"),
-            (ConditionBasedServiceReport, "condition_based_services"),
-            (CheckControlMessageReport, "check_control_messages"),
-            (Headunit, "headunit"),
-            (Climate, "climate"),
-            (ChargingProfile, "charging_profile"),
-            (Tires, "tires"),
-        ]
-        for cls, vehicle_attribute in update_entities:
+        for cls, vehicle_attribute in _VEHICLE_DATA_ENTITIES:
             try:
-                if getattr(self, vehicle_attribute) is None:
+                curr_attr: Optional[VehicleDataBase] = getattr(self, vehicle_attribute)
+                if curr_attr is None:
                     setattr(self, vehicle_attribute, cls.from_vehicle_data(vehicle_data))
                 else:
-                    curr_attr: VehicleDataBase = getattr(self, vehicle_attribute)
                     curr_attr.update_from_vehicle_data(vehicle_data)
             except (KeyError, TypeError) as ex:
                 _LOGGER.warning("Unable to update %s - (%s) %s", vehicle_attribute, type(ex).__name__, ex)
@@ -176,13 +189,11 @@ class MyBMWVehicle:
         if isinstance(data, dict):
             data = [data]
 
-        vehicle_data = {
-            ATTR_ATTRIBUTES: {},
-            ATTR_CAPABILITIES: {},
-            ATTR_STATE: {},
-            ATTR_CHARGING_SETTINGS: {},
-            **self.data,
-        }
+        # Work on a copy so that self.data is only replaced as a whole, only add missing containers
+        vehicle_data = dict(self.data)
+        for key in _VEHICLE_DATA_KEYS:
+            if key not in vehicle_data:
+                vehicle_data[key] = {}
 
         for entry in data:
             vehicle_data.update(entry)
@@ -292,7 +303,7 @@ class MyBMWVehicle:
     @property
     def is_lsc_enabled(self) -> bool:
         """Return True if LastStateCall is enabled (vehicle automatically updates API)."""
-        return self.data[ATTR_STATE]["isLscSupported"]
+        return self.data[ATTR_STATE].get("isLscSupported", False)
 
     @property
     def is_remote_set_target_soc_enabled(self) -> bool: